@@ -4,11 +4,11 @@ Clients connect to /api/events to receive push notifications when job status cha
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime, timezone
-from typing import AsyncGenerator, List, Optional
+from typing import AsyncGenerator, Dict, List, Optional
 
+import orjson
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
 from redis.asyncio import Redis
@@ -26,12 +26,55 @@ JOB_UPDATES_CHANNEL = "job_updates"
 # Heartbeat interval in seconds
 HEARTBEAT_INTERVAL = 30
 
+# Shared client for publish_job_update (each SSE subscriber still gets its own)
+_publish_redis: Optional[Redis] = None
+
+# Single consumer draining job updates to Redis, so callers never wait on the publish.
+# Only the latest unpublished update per job is kept: a backlog collapses to each job's
+# current state (terminal events included) instead of growing or dropping updates.
+_pending_updates: Dict[str, bytes] = {}  # job_id -> payload, oldest job first
+_publish_wakeup: Optional[asyncio.Event] = None
+_publish_pump_task: Optional[asyncio.Task] = None
+
 
 def get_redis_client() -> Redis:
     """Create a Redis client for pub/sub."""
     return Redis.from_url(settings.redis_url, decode_responses=True)
 
 
+def _get_publish_redis() -> Redis:
+    """Return the process-wide publishing client, creating it on first use."""
+    global _publish_redis
+    if _publish_redis is None:
+        _publish_redis = get_redis_client()
+    return _publish_redis
+
+
+async def _publish_pump(wakeup: asyncio.Event) -> None:
+    """Publish pending job updates to Redis one at a time."""
+    while True:
+        await wakeup.wait()
+        wakeup.clear()
+        while _pending_updates:
+            job_id = next(iter(_pending_updates))
+            payload = _pending_updates.pop(job_id)
+            try:
+                await _get_publish_redis().publish(JOB_UPDATES_CHANNEL, payload)
+            except Exception as e:
+                logger.error("Failed to publish job update: %s", e)
+
+
+def _queue_update(job_id: str, payload: bytes) -> None:
+    """Queue *payload* as *job_id*'s next update, (re)starting the pump if needed."""
+    global _publish_wakeup, _publish_pump_task
+    if _publish_pump_task is None or _publish_pump_task.done():
+        _publish_wakeup = asyncio.Event()
+        _publish_pump_task = asyncio.create_task(_publish_pump(_publish_wakeup))
+    # Replacing an unpublished update keeps the job's place in line
+    _pending_updates[job_id] = payload
+    _publish_wakeup.set()
+
+
 async def event_stream(request: Request) -> AsyncGenerator[str, None]:
     """
     Generate SSE events from Redis pub/sub.
@@ -120,14 +163,10 @@ def format_sse_event(event: str, data: dict) -> str:
     Returns:
         SSE-formatted string with event and data fields
     """
-    # If data is a string, parse it (from Redis messages)
-    if isinstance(data, str):
-        try:
-            data = json.loads(data)
-        except json.JSONDecodeError:
-            data = {"raw": data}
-    
-    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    # Strings are Redis messages, already compact single-line JSON from
+    # publish_job_update; forward them as-is instead of re-encoding per client
+    payload = data if isinstance(data, str) else orjson.dumps(data).decode()
+    return f"event: {event}\ndata: {payload}\n\n"
 
 
 def format_sse_comment(comment: str) -> str:
@@ -191,7 +230,9 @@ async def publish_job_update(
     Publish a job update to Redis for SSE distribution.
 
     This function is called by the job processor when job status changes.
-    All connected SSE clients will receive the update.
+    All connected SSE clients will receive the update. The update is queued
+    for a background pump and this returns without waiting on Redis; if the
+    job's previous update has not gone out yet, this one replaces it.
 
     Args:
         job_id: The job ID (UUID or string)
@@ -207,8 +248,6 @@ async def publish_job_update(
         completed_at: Optional; when job reached completed/merged (for SSE time display)
         duration_seconds: Optional; processing duration in seconds (for SSE time display)
     """
-    redis = get_redis_client()
-
     try:
         # Convert UUID to string if necessary
         if hasattr(job_id, 'hex'):
@@ -242,10 +281,8 @@ async def publish_job_update(
         if duration_seconds is not None:
             data["duration_seconds"] = duration_seconds
 
-        await redis.publish(JOB_UPDATES_CHANNEL, json.dumps(data))
-        logger.debug("Published job update: %s", data)
-        
+        _queue_update(job_id, orjson.dumps(data))
+        logger.debug("Queued job update: %s", data)
+
     except Exception as e:
         logger.error("Failed to publish job update: %s", e)
-    finally:
-        await redis.close()
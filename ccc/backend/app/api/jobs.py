@@ -7,13 +7,13 @@ GET  /api/jobs/{id}    – get single job details
 """
 
 import asyncio
-import json
 import os
 import shutil
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import List, Optional
 
+import orjson
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Query, UploadFile
 from pydantic import BaseModel
 from sqlalchemy import cast, func, select, String, text
@@ -49,12 +49,19 @@ def _parse_json_tags(raw: Optional[str]) -> Optional[List[str]]:
     if not raw:
         return None
     try:
-        out = json.loads(raw)
+        out = orjson.loads(raw)
         return out if isinstance(out, list) else None
-    except (json.JSONDecodeError, TypeError):
+    except (orjson.JSONDecodeError, TypeError):
         return None
 
 
+def _save_upload(src, job_dir: str, dest: str) -> None:
+    """Create *job_dir* and copy the uploaded file object into *dest* (blocking)."""
+    os.makedirs(job_dir, exist_ok=True)
+    with open(dest, "wb") as f:
+        shutil.copyfileobj(src, f)
+
+
 class SzuruPostMirror(BaseModel):
     """Mirrors the post as stored on Szurubooru (what we offload to them)."""
 
@@ -251,7 +258,7 @@ async def create_job_url(
         job_type=JobType.URL,
         url=url,
         source_override=body.source,
-        initial_tags=json.dumps(body.tags) if body.tags else None,
+        initial_tags=orjson.dumps(body.tags).decode() if body.tags else None,
         safety=body.safety or "unsafe",
         skip_tagging=1 if body.skip_tagging else 0,
         szuru_user=current_user.szuru_username,
@@ -277,11 +284,9 @@ async def create_job_file(
     """Create a job from a file upload."""
     job_id = uuid.uuid4()
     job_dir = os.path.join(settings.job_data_dir, str(job_id))
-    os.makedirs(job_dir, exist_ok=True)
-
     dest = os.path.join(job_dir, file.filename or "upload")
-    with open(dest, "wb") as f:
-        shutil.copyfileobj(file.file, f)
+    # Large uploads: copy the spooled file to disk without blocking the event loop
+    await asyncio.to_thread(_save_upload, file.file, job_dir, dest)
 
     # Parse tags from comma-separated string or JSON array
     parsed_tags = _parse_json_tags(tags) if tags else None
@@ -294,7 +299,7 @@ async def create_job_file(
         job_type=JobType.FILE,
         original_filename=file.filename,
         source_override=source,
-        initial_tags=json.dumps(parsed_tags) if parsed_tags else None,
+        initial_tags=orjson.dumps(parsed_tags).decode() if parsed_tags else None,
         safety=safety,
         skip_tagging=1 if skip_tagging else 0,
         szuru_user=current_user.szuru_username,
@@ -511,7 +516,7 @@ async def _bg_bulk_retry(job_ids: List[str], user_ctx: _BulkUserContext) -> None
                 
                 job.error_message = None
                 job.retry_count = 0
-                job.updated_at = datetime.now(timezone.utc)
+                job.updated_at = func.now()
                 
                 if retry_delay > 0:
                     # Keep job in FAILED status during delay, will be set to PENDING after delay
@@ -528,7 +533,7 @@ async def _bg_bulk_retry(job_ids: List[str], user_ctx: _BulkUserContext) -> None
                                 return
                             # Set to PENDING so worker can pick it up
                             j.status = JobStatus.PENDING
-                            j.updated_at = datetime.now(timezone.utc)
+                            j.updated_at = func.now()
                             await check_db.commit()
                         await publish_job_update(job_id=job.id, status="pending", progress=0)
                     
@@ -555,7 +560,7 @@ async def _bg_bulk_delete(job_ids: List[str], user_ctx: _BulkUserContext) -> Non
                 job_dir = os.path.join(settings.job_data_dir, job_id)
                 if os.path.isdir(job_dir):
                     try:
-                        shutil.rmtree(job_dir, ignore_errors=True)
+                        await asyncio.to_thread(shutil.rmtree, job_dir, ignore_errors=True)
                     except Exception:
                         pass
                 await db.delete(job)
@@ -590,7 +595,7 @@ async def _bg_bulk_pause(job_ids: List[str], user_ctx: _BulkUserContext) -> None
                 if not job or not _user_ctx_can_access_job(job, user_ctx) or job.status not in allowed:
                     continue
                 job.status = JobStatus.PAUSED
-                job.updated_at = datetime.now(timezone.utc)
+                job.updated_at = func.now()
                 await db.commit()
                 await db.refresh(job)
                 await publish_job_update(job_id=job.id, status="paused")
@@ -609,7 +614,7 @@ async def _bg_bulk_stop(job_ids: List[str], user_ctx: _BulkUserContext) -> None:
                 if not job or not _user_ctx_can_access_job(job, user_ctx) or job.status in terminal:
                     continue
                 job.status = JobStatus.STOPPED
-                job.updated_at = datetime.now(timezone.utc)
+                job.updated_at = func.now()
                 await db.commit()
                 await db.refresh(job)
                 await publish_job_update(job_id=job.id, status="stopped")
@@ -629,7 +634,7 @@ async def _bg_bulk_resume(job_ids: List[str], user_ctx: _BulkUserContext) -> Non
                     continue
                 job.status = JobStatus.PENDING
                 job.started_at = None
-                job.updated_at = datetime.now(timezone.utc)
+                job.updated_at = func.now()
                 await db.commit()
                 await db.refresh(job)
                 await publish_job_update(job_id=job.id, status="pending", progress=0)
@@ -787,7 +792,7 @@ async def pause_job(
         )
 
     job.status = JobStatus.PAUSED
-    job.updated_at = datetime.now(timezone.utc)
+    job.updated_at = func.now()
     await db.commit()
     await db.refresh(job)
 
@@ -821,7 +826,7 @@ async def stop_job(
         )
 
     job.status = JobStatus.STOPPED
-    job.updated_at = datetime.now(timezone.utc)
+    job.updated_at = func.now()
     await db.commit()
     await db.refresh(job)
 
@@ -848,7 +853,7 @@ async def delete_job(
     job_dir = os.path.join(settings.job_data_dir, job_id)
     if os.path.isdir(job_dir):
         try:
-            shutil.rmtree(job_dir, ignore_errors=True)
+            await asyncio.to_thread(shutil.rmtree, job_dir, ignore_errors=True)
         except Exception:
             pass  # Ignore cleanup errors
 
@@ -895,7 +900,7 @@ async def retry_job(
 
     job.error_message = None
     job.retry_count = 0
-    job.updated_at = datetime.now(timezone.utc)
+    job.updated_at = func.now()
     
     if retry_delay > 0:
         # Keep job in FAILED status during delay, will be set to PENDING after delay
@@ -912,7 +917,7 @@ async def retry_job(
                     return
                 # Set to PENDING so worker can pick it up
                 j.status = JobStatus.PENDING
-                j.updated_at = datetime.now(timezone.utc)
+                j.updated_at = func.now()
                 await check_db.commit()
             await publish_job_update(job_id=job.id, status="pending", progress=0)
         
@@ -955,7 +960,7 @@ async def resume_job(
 
     job.status = JobStatus.PENDING
     job.started_at = None
-    job.updated_at = datetime.now(timezone.utc)
+    job.updated_at = func.now()
     await db.commit()
     await db.refresh(job)
 
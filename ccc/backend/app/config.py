@@ -38,10 +38,17 @@ class Settings:
     # Use a subprocess for CPU inference to bypass the GIL (only beneficial with a single worker;
     # disable when worker_concurrency > 1 so all workers share the thread pool concurrently)
     wd14_use_process_pool: bool = os.getenv("WD14_USE_PROCESS_POOL", "false").lower() == "true"
+    # Max images stacked into a single WD14 forward pass (multi-file jobs and video frames)
+    wd14_batch_size: int = int(os.getenv("WD14_BATCH_SIZE", "8"))
 
     # --- Worker & Paths ---
     # worker_concurrency requires a restart (workers are spawned at startup), so it lives in ENV.
     worker_concurrency: int = int(os.getenv("WORKER_CONCURRENCY", "1"))
+    # Per-job limits on media downloaded from the source / uploaded to Szurubooru at once
+    media_download_concurrency: int = int(os.getenv("MEDIA_DOWNLOAD_CONCURRENCY", "3"))
+    media_upload_concurrency: int = int(os.getenv("MEDIA_UPLOAD_CONCURRENCY", "3"))
+    # Open connections to Szurubooru shared by all workers; further requests wait for one
+    szuru_max_connections: int = int(os.getenv("SZURU_MAX_CONNECTIONS", "100"))
     job_data_dir: str = os.getenv("JOB_DATA_DIR", "/data/jobs")
 
     # --- Server ---
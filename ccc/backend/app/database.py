@@ -12,10 +12,12 @@ from sqlalchemy import (
     Column,
     DateTime,
     Enum,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
@@ -29,6 +31,8 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     pool_pre_ping=True,
+    # Each worker keeps one session per job; leave headroom for API requests on top.
+    pool_size=max(5, settings.worker_concurrency + 5),
 )
 
 async_session = sessionmaker(
@@ -118,6 +122,11 @@ class Job(Base):
         onupdate=lambda: datetime.now(timezone.utc),
     )
 
+    # Partial index backing the worker's claim of the oldest PENDING job
+    __table_args__ = (
+        Index("idx_jobs_pending_created", "created_at", postgresql_where=text("status = 'PENDING'")),
+    )
+
 
 class TagCache(Base):
     """Cache of tags verified to exist in Szurubooru with the correct category."""
@@ -34,7 +34,7 @@ from app.services.szurubooru import (
     close_session as close_szuru_session,
     load_tag_cache,
 )
-from app.workers.processor import start_worker, stop_worker
+from app.workers.processor import reset_inflight_jobs_on_startup, start_worker, stop_worker
 
 settings = get_settings()
 
@@ -71,6 +71,7 @@ async def lifespan(app: FastAPI):
     await init_szuru_session()
     await load_tag_cache()
 
+    await reset_inflight_jobs_on_startup()
     num_workers = settings.worker_concurrency
     logger.info("Starting %d background worker(s) (WORKER_CONCURRENCY)...", num_workers)
     worker_tasks = [asyncio.create_task(start_worker(i)) for i in range(num_workers)]
@@ -0,0 +1,13 @@
+CREATE OR REPLACE FUNCTION notify_pending_job() RETURNS trigger AS $$
+BEGIN
+  PERFORM pg_notify('jobs_new', NEW.id::text);
+  RETURN NEW;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS jobs_notify_pending ON jobs;
+
+CREATE TRIGGER jobs_notify_pending
+  AFTER INSERT OR UPDATE OF status ON jobs
+  FOR EACH ROW
+  WHEN (NEW.status = 'PENDING')
+  EXECUTE FUNCTION notify_pending_job();
@@ -0,0 +1,7 @@
+CREATE TABLE IF NOT EXISTS content_hashes (
+    sha256        VARCHAR(64)  NOT NULL,
+    szuru_url     VARCHAR(512) NOT NULL,
+    szuru_post_id INTEGER      NOT NULL,
+    updated_at    TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (sha256, szuru_url)
+);
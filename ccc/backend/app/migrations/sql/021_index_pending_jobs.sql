@@ -0,0 +1 @@
+CREATE INDEX IF NOT EXISTS idx_jobs_pending_created ON jobs(created_at) WHERE status = 'PENDING';
@@ -0,0 +1,13 @@
+CREATE OR REPLACE FUNCTION notify_aborted_job() RETURNS trigger AS $$
+BEGIN
+  PERFORM pg_notify('jobs_abort', NEW.id::text);
+  RETURN NEW;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS jobs_notify_aborted ON jobs;
+
+CREATE TRIGGER jobs_notify_aborted
+  AFTER UPDATE OF status ON jobs
+  FOR EACH ROW
+  WHEN (NEW.status IN ('PAUSED', 'STOPPED'))
+  EXECUTE FUNCTION notify_aborted_job();
@@ -15,12 +15,17 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
+import aiofiles
+
 from app.config import get_settings
 from app.sites.registry import get_handler
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Direct downloads are streamed to disk in chunks of this size.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 # User-Agent used for all direct HTTP downloads (avoids blocks from CDNs that reject empty UA).
 DEFAULT_DOWNLOAD_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/115.0"
@@ -214,6 +219,7 @@ async def download_direct_media_url(url: str, dest_dir: str, filename: Optional[
     result = DownloadResult(source_url=url, used_tool="direct")
 
     headers = {"User-Agent": DEFAULT_DOWNLOAD_USER_AGENT}
+    part_path: Optional[Path] = None  # set while the body is being written
 
     try:
         async with aiohttp.ClientSession() as session:
@@ -270,13 +276,21 @@ async def download_direct_media_url(url: str, dest_dir: str, filename: Optional[
                         file_path = Path(dest_dir) / f"{base}_{counter}{suffix}"
                         counter += 1
                 
-                # Write the file
-                content = await resp.read()
-                with open(file_path, "wb") as f:
-                    f.write(content)
+                # Stream the body to disk; aiofiles writes in a thread so large
+                # videos neither sit in memory nor block the event loop. Written to a
+                # .part file first so a failed transfer never leaves a truncated file
+                # behind for the gallery-dl fallback to pick up from dest_dir
+                part_path = file_path.with_name(file_path.name + ".part")
+                size = 0
+                async with aiofiles.open(part_path, "wb") as f:
+                    async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        await f.write(chunk)
+                        size += len(chunk)
+                os.replace(part_path, file_path)
+                part_path = None
                 
                 result.files = [file_path]
-                logger.info("Direct download saved %s (%d bytes)", file_path.name, len(content))
+                logger.info("Direct download saved %s (%d bytes)", file_path.name, size)
                 
     except asyncio.TimeoutError:
         result.error = "Direct download timed out"
@@ -284,6 +298,9 @@ async def download_direct_media_url(url: str, dest_dir: str, filename: Optional[
     except Exception as exc:
         result.error = str(exc)
         logger.exception("Direct download failed for %s", url)
+    finally:
+        if part_path is not None:
+            part_path.unlink(missing_ok=True)
     
     return result
 
@@ -669,28 +686,8 @@ async def _try_gallery_dl(
             result.error = err
             # Don't return early – there may still be files.
 
-        # Collect downloaded files (gallery-dl writes into subdirs).
-        # Note: gallery-dl may create .txt files for tweet content (Twitter postprocessor)
-        # and .json files for metadata. We only want the actual media files.
-        files: List[Path] = []
-        metadata: Dict = {}
-        for root, _dirs, filenames in os.walk(dest_dir):
-            for fn in filenames:
-                fp = Path(root) / fn
-                if fn.endswith(".json"):
-                    # gallery-dl metadata sidecar
-                    try:
-                        with open(fp, "r", encoding="utf-8") as f:
-                            metadata = json.load(f)
-                    except Exception:
-                        pass
-                elif fn.endswith(".txt"):
-                    # Tweet content file from Twitter postprocessor - skip
-                    logger.debug("Skipping tweet content file: %s", fn)
-                    pass
-                else:
-                    logger.debug("Found media file: %s", fn)
-                    files.append(fp)
+        # Directory walk + sidecar parsing run in a thread (large galleries)
+        files, metadata = await asyncio.to_thread(_collect_gallery_dl_output, dest_dir)
         
         logger.info("gallery-dl downloaded %d media file(s) to %s", len(files), dest_dir)
 
@@ -712,6 +709,34 @@ async def _try_gallery_dl(
     return result
 
 
+def _collect_gallery_dl_output(dest_dir: str) -> Tuple[List[Path], Dict]:
+    """
+    Collect downloaded files (gallery-dl writes into subdirs). Blocking; run in a thread.
+
+    Note: gallery-dl may create .txt files for tweet content (Twitter postprocessor)
+    and .json files for metadata. We only want the actual media files.
+    """
+    files: List[Path] = []
+    metadata: Dict = {}
+    for root, _dirs, filenames in os.walk(dest_dir):
+        for fn in filenames:
+            fp = Path(root) / fn
+            if fn.endswith(".json"):
+                # gallery-dl metadata sidecar
+                try:
+                    with open(fp, "r", encoding="utf-8") as f:
+                        metadata = json.load(f)
+                except Exception:
+                    pass
+            elif fn.endswith(".txt"):
+                # Tweet content file from Twitter postprocessor - skip
+                logger.debug("Skipping tweet content file: %s", fn)
+            else:
+                logger.debug("Found media file: %s", fn)
+                files.append(fp)
+    return files, metadata
+
+
 # ---------------------------------------------------------------------------
 # yt-dlp
 # ---------------------------------------------------------------------------
@@ -743,18 +768,7 @@ async def _try_ytdlp(url: str, dest_dir: str, ytdlp_timeout: int = 300) -> Downl
             return result
 
         # Collect files
-        files: List[Path] = []
-        metadata: Dict = {}
-        for fn in os.listdir(dest_dir):
-            fp = Path(dest_dir) / fn
-            if fn.endswith(".info.json"):
-                try:
-                    with open(fp, "r", encoding="utf-8") as f:
-                        metadata = json.load(f)
-                except Exception:
-                    pass
-            elif fp.is_file():
-                files.append(fp)
+        files, metadata = await asyncio.to_thread(_collect_ytdlp_output, dest_dir)
 
         result.files = files
         result.metadata = metadata
@@ -770,3 +784,20 @@ async def _try_ytdlp(url: str, dest_dir: str, ytdlp_timeout: int = 300) -> Downl
         logger.exception("yt-dlp unexpected error")
 
     return result
+
+
+def _collect_ytdlp_output(dest_dir: str) -> Tuple[List[Path], Dict]:
+    """Collect yt-dlp media files and its ``.info.json`` metadata. Blocking; run in a thread."""
+    files: List[Path] = []
+    metadata: Dict = {}
+    with os.scandir(dest_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".info.json"):
+                try:
+                    with open(entry.path, "r", encoding="utf-8") as f:
+                        metadata = json.load(f)
+                except Exception:
+                    pass
+            elif entry.is_file(follow_symlinks=False):
+                files.append(Path(entry.path))
+    return files, metadata
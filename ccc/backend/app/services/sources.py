@@ -7,7 +7,8 @@ Uses site-handler normalization so that URL variants like
 are treated as duplicates.
 """
 
-from typing import List, Optional, Set
+from functools import lru_cache
+from typing import Iterable, List, Optional, Set
 from urllib.parse import urlparse
 
 from app.sites import normalize_url_for_comparison as _site_normalize_url
@@ -18,11 +19,15 @@ from app.sites import normalize_url_for_comparison as _site_normalize_url
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=4096)
 def normalize_for_comparison(url: str) -> str:
     """
     Normalize a URL for similarity comparison.
     Delegates to the site handler first; falls back to stripping query params
     and trailing slashes.
+
+    Memoized: the same source URLs come back on every merge, and each miss walks
+    every site handler.
     """
     if not url:
         return ""
@@ -74,6 +79,27 @@ def append_source(existing: Optional[str], url: str) -> str:
     return f"{existing}\n{url}"
 
 
+def merge_sources(existing: Optional[str], urls: Iterable[str]) -> Optional[str]:
+    """
+    Append every URL in *urls* to *existing*, skipping normalized duplicates.
+
+    Same result as calling ``append_source`` per URL, but *existing* is
+    split and normalized only once.
+    """
+    merged = existing
+    seen = get_normalized_set(existing)
+    for url in urls:
+        url = url.strip()
+        if not url:
+            continue
+        norm = normalize_for_comparison(url)
+        if norm in seen:
+            continue
+        seen.add(norm)
+        merged = f"{merged}\n{url}" if merged else url
+    return merged
+
+
 def build_source_string(
     direct_media_url: Optional[str],
     original_page_url: Optional[str],
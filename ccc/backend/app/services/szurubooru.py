@@ -11,13 +11,16 @@ import base64
 import contextvars
 import json
 import logging
+import random
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
+import aiofiles
 import aiohttp
 
 from app.config import get_settings
@@ -72,12 +75,22 @@ def _auth_headers() -> Dict[str, str]:
 
 _session: Optional[aiohttp.ClientSession] = None
 
+# Idle connections outlive the gap between jobs (aiohttp default: 15s), so the
+# concurrent tag/search/upload calls of the next job reuse warm sockets
+_KEEPALIVE_SECONDS = 60
+_DNS_CACHE_SECONDS = 300
+
 
 async def init_session() -> None:
     """Create the persistent aiohttp session.  Call once at startup."""
     global _session
     if _session is None or _session.closed:
-        _session = aiohttp.ClientSession()
+        connector = aiohttp.TCPConnector(
+            limit=max(1, settings.szuru_max_connections),
+            keepalive_timeout=_KEEPALIVE_SECONDS,
+            ttl_dns_cache=_DNS_CACHE_SECONDS,
+        )
+        _session = aiohttp.ClientSession(connector=connector)
 
 
 async def close_session() -> None:
@@ -136,15 +149,93 @@ async def _request(
                 return await resp.json()
             error_text = await resp.text()
             return {"error": error_text, "status": resp.status}
+    except aiohttp.ClientConnectorError as exc:
+        # Never reached the server, so the request was definitely not applied
+        return {"error": str(exc), "status": 0, "not_sent": True}
     except Exception as exc:
         return {"error": str(exc), "status": 0}
 
 
+# ---------------------------------------------------------------------------
+# Retries & circuit breaker (uploads and post updates)
+# ---------------------------------------------------------------------------
+
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5  # seconds; attempt n waits uniform(0, base * 2**n)
+BREAKER_FAILURE_THRESHOLD = 5  # consecutive transient failures that open the circuit
+BREAKER_OPEN_SECONDS = 30
+
+
+@dataclass
+class _CircuitState:
+    failures: int = 0
+    open_until: float = 0.0  # time.monotonic(); calls are refused until then
+    probing: bool = False  # half-open: the single trial call is in flight
+
+
+_circuits: Dict[str, _CircuitState] = {}  # key: Szurubooru base URL
+
+
+def _is_transient(result: dict) -> bool:
+    """Connection errors/timeouts (status 0) and 5xx responses: the instance may be unhealthy."""
+    if "error" not in result:
+        return False
+    status = result.get("status", 0)
+    return status == 0 or status >= 500
+
+
+async def _with_retry(call: Callable[[], Awaitable[dict]], idempotent: bool = True) -> dict:
+    """
+    Run *call* (one ``_request``-style attempt), retrying transient failures with
+    exponential backoff and full jitter.
+
+    A non-idempotent call (creating or editing a post) is only retried when the
+    connection could not be established. After a timeout or 5xx the server may
+    already have applied it, and a repeat would fail as a duplicate/version conflict.
+
+    Consecutive transient failures against one Szurubooru instance open a circuit:
+    further calls fail fast for ``BREAKER_OPEN_SECONDS`` instead of piling onto an
+    instance that is down. After that the circuit is half-open: exactly one call is
+    let through as a probe while the others keep failing fast. A successful probe
+    closes the circuit, a failed one reopens it.
+    """
+    circuit = _circuits.setdefault(_current_szuru_url.get() or "", _CircuitState())
+    result: dict = {}
+    for attempt in range(RETRY_ATTEMPTS):
+        is_probe = False
+        if circuit.open_until:
+            if time.monotonic() < circuit.open_until or circuit.probing:
+                return {"error": "Szurubooru unavailable (too many recent failures), try again later",
+                        "status": 0}
+            circuit.probing = is_probe = True
+        try:
+            result = await call()
+        finally:
+            if is_probe:
+                circuit.probing = False
+        if not _is_transient(result):
+            circuit.failures = 0
+            circuit.open_until = 0.0
+            return result
+        circuit.failures += 1
+        if is_probe or circuit.failures >= BREAKER_FAILURE_THRESHOLD:
+            circuit.open_until = time.monotonic() + BREAKER_OPEN_SECONDS
+            logger.warning("Szurubooru failing (%d transient errors in a row), pausing calls for %ds: %s",
+                           circuit.failures, BREAKER_OPEN_SECONDS, result.get("error"))
+            return result
+        if not idempotent and not result.get("not_sent"):
+            return result
+        if attempt + 1 < RETRY_ATTEMPTS:
+            await asyncio.sleep(random.uniform(0, RETRY_BASE_DELAY * 2 ** attempt))
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Tag cache (in-memory + PostgreSQL)
 # ---------------------------------------------------------------------------
 
 TAG_CACHE_TTL_SECONDS = 30 * 24 * 3600  # 30 days
+TAG_CACHE_MAX_ENTRIES = 100_000  # in-memory LRU bound; least recently used entries are evicted
 
 
 @dataclass
@@ -153,7 +244,10 @@ class _TagCacheEntry:
     verified_at: float   # time.time() epoch
 
 
-_tag_cache: Dict[str, _TagCacheEntry] = {}  # key: tag_name.lower()
+_tag_cache: "OrderedDict[str, _TagCacheEntry]" = OrderedDict()  # key: tag_name.lower(), LRU order
+
+# In-flight ensure requests, so concurrent callers for the same tag share one API call
+_inflight_tags: Dict[Tuple[str, str], "asyncio.Future[bool]"] = {}  # key: (name.lower(), category.lower())
 
 
 async def load_tag_cache() -> None:
@@ -164,10 +258,14 @@ async def load_tag_cache() -> None:
     cutoff = datetime.now(timezone.utc) - timedelta(seconds=TAG_CACHE_TTL_SECONDS)
     async with async_session() as db:
         result = await db.execute(
-            select(TagCache).where(TagCache.verified_at >= cutoff)
+            select(TagCache)
+            .where(TagCache.verified_at >= cutoff)
+            .order_by(TagCache.verified_at.desc())
+            .limit(TAG_CACHE_MAX_ENTRIES)
         )
         rows = result.scalars().all()
-        for row in rows:
+        # Oldest first, so the most recently verified tags end up most recently used
+        for row in reversed(rows):
             _tag_cache[row.tag_name.lower()] = _TagCacheEntry(
                 category=row.category.lower(),
                 verified_at=row.verified_at.timestamp(),
@@ -177,32 +275,56 @@ async def load_tag_cache() -> None:
 
 async def _update_tag_cache_db(tag_name: str, category: str) -> None:
     """Upsert a tag cache entry into PostgreSQL."""
+    await _update_tag_cache_db_many([(tag_name, category)])
+
+
+async def _update_tag_cache_db_many(tags: List[Tuple[str, str]]) -> None:
+    """Upsert ``(tag_name, category)`` cache entries into PostgreSQL in one statement."""
     from app.database import TagCache, async_session
     from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+    if not tags:
+        return
     now = datetime.now(timezone.utc)
+    # One row per name: ON CONFLICT cannot touch the same row twice in a statement
+    rows = {
+        name.lower(): {"tag_name": name.lower(), "category": cat.lower(), "verified_at": now}
+        for name, cat in tags
+    }
     try:
         async with async_session() as db:
-            stmt = pg_insert(TagCache).values(
-                tag_name=tag_name.lower(),
-                category=category.lower(),
-                verified_at=now,
-            ).on_conflict_do_update(
+            stmt = pg_insert(TagCache).values(list(rows.values()))
+            stmt = stmt.on_conflict_do_update(
                 index_elements=["tag_name"],
-                set_={"category": category.lower(), "verified_at": now},
+                set_={"category": stmt.excluded.category, "verified_at": stmt.excluded.verified_at},
             )
             await db.execute(stmt)
             await db.commit()
     except Exception:
-        logger.debug("Failed to persist tag cache entry for %s", tag_name, exc_info=True)
+        logger.debug("Failed to persist %d tag cache entries", len(rows), exc_info=True)
+
+
+def _is_cached(cache_key: str, category: str, now: float) -> bool:
+    """True if *cache_key* (lowercased name) is cached fresh with *category* (lowercased)."""
+    entry = _tag_cache.get(cache_key)
+    if (entry is not None
+            and entry.category == category
+            and (now - entry.verified_at) < TAG_CACHE_TTL_SECONDS):
+        _tag_cache.move_to_end(cache_key)
+        return True
+    return False
 
 
 def _cache_tag(tag_name: str, category: str) -> None:
     """Update the in-memory cache for a tag."""
-    _tag_cache[tag_name.lower()] = _TagCacheEntry(
+    cache_key = tag_name.lower()
+    _tag_cache[cache_key] = _TagCacheEntry(
         category=category.lower(),
         verified_at=time.time(),
     )
+    _tag_cache.move_to_end(cache_key)
+    while len(_tag_cache) > TAG_CACHE_MAX_ENTRIES:
+        _tag_cache.popitem(last=False)
 
 
 # ---------------------------------------------------------------------------
@@ -239,20 +361,20 @@ async def upload_post(
     if source:
         metadata["source"] = source
 
-    data = aiohttp.FormData()
-    data.add_field(
-        "metadata",
-        json.dumps(metadata),
-        content_type="application/json",
-    )
-
-    with open(file_path, "rb") as f:
-        file_bytes = f.read()
-
     mime_type = guess_mime_type(str(file_path))
-    data.add_field("content", file_bytes, filename=file_path.name, content_type=mime_type)
+    metadata_json = json.dumps(metadata)
+
+    async def _attempt() -> dict:
+        # A streamed body can't be replayed, so each attempt builds a fresh form
+        data = aiohttp.FormData()
+        data.add_field("metadata", metadata_json, content_type="application/json")
+        # aiohttp streams an open file in chunks read off the event loop, so the media is
+        # never loaded into memory whole
+        with open(file_path, "rb") as f:
+            data.add_field("content", f, filename=file_path.name, content_type=mime_type)
+            return await _request("POST", "/api/posts/", form_data=data, timeout=60)
 
-    return await _request("POST", "/api/posts/", form_data=data, timeout=60)
+    return await _with_retry(_attempt, idempotent=False)
 
 
 # ---------------------------------------------------------------------------
@@ -283,9 +405,10 @@ async def _get_tag_by_name(tag_name: str) -> Optional[Dict]:
     if "error" in result:
         return None
     results = result.get("results") or []
+    wanted = tag_name.lower()
     for tag in results:
         names = tag.get("names") or []
-        if any(n.lower() == tag_name.lower() for n in names):
+        if any(n.lower() == wanted for n in names):
             return tag
     return None
 
@@ -298,16 +421,34 @@ async def ensure_tag(tag_name: str, category: str = "default") -> bool:
     redundant API calls.
     """
     cache_key = tag_name.lower()
-    now = time.time()
 
     # Check in-memory cache
-    entry = _tag_cache.get(cache_key)
-    if (entry
-            and entry.category == category.lower()
-            and (now - entry.verified_at) < TAG_CACHE_TTL_SECONDS):
+    if _is_cached(cache_key, category.lower(), time.time()):
         return True  # Fresh cache hit — skip all API calls
 
-    # Cache miss or stale — try to create the tag
+    # Cache miss or stale — join an in-flight request for the same tag if there is one
+    key = (cache_key, category.lower())
+    pending = _inflight_tags.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+    task = asyncio.ensure_future(_create_or_update_tag(tag_name, category))
+    _inflight_tags[key] = task
+    # Unregister when the request itself finishes, not when this caller stops waiting:
+    # a cancelled caller must not let the next one start a duplicate create
+    task.add_done_callback(lambda t: _inflight_tags.pop(key, None) if _inflight_tags.get(key) is t else None)
+    return await asyncio.shield(task)
+
+
+def _tag_category_name(tag: Dict) -> str:
+    """Lowercased category name of a tag resource (the API returns a name or an object)."""
+    category = tag.get("category")
+    if isinstance(category, dict):
+        category = category.get("name")
+    return (category or "").strip().lower()
+
+
+async def _create_or_update_tag(tag_name: str, category: str) -> bool:
+    """Create *tag_name* with *category*, or fix the category of an existing tag."""
     result = await _request(
         "POST", "/api/tags",
         json_payload={"names": [tag_name], "category": category},
@@ -333,12 +474,7 @@ async def ensure_tag(tag_name: str, category: str = "default") -> bool:
         await _update_tag_cache_db(tag_name, category)
         return True
 
-    current_cat = existing.get("category")
-    if isinstance(current_cat, dict):
-        current_cat = (current_cat.get("name") or "").strip().lower()
-    else:
-        current_cat = (current_cat or "").strip().lower()
-
+    current_cat = _tag_category_name(existing)
     if current_cat == category.lower():
         # Category already matches
         _cache_tag(tag_name, category)
@@ -376,6 +512,31 @@ async def ensure_tag(tag_name: str, category: str = "default") -> bool:
 # ---------------------------------------------------------------------------
 
 _TAG_CONCURRENCY = 10
+_TAG_LOOKUP_CHUNK = 50  # names per bulk ``name:a,b,c`` search
+# Names containing search syntax characters are left to the per-tag path
+_TAG_QUERY_SPECIAL = frozenset("\\,*:")
+
+
+async def _lookup_existing_tags(names: List[str]) -> Dict[str, str]:
+    """
+    Return ``{name.lower(): category}`` for those *names* that already exist in
+    Szurubooru, using one tag search per ``_TAG_LOOKUP_CHUNK`` names. Names that
+    cannot be put in a search query, and failed searches, are simply left out.
+    """
+    queryable = [n for n in names if not _TAG_QUERY_SPECIAL.intersection(n) and not n.startswith("-")]
+    chunks = [queryable[i:i + _TAG_LOOKUP_CHUNK] for i in range(0, len(queryable), _TAG_LOOKUP_CHUNK)]
+    results = await asyncio.gather(
+        *(search_tags("name:" + ",".join(chunk), limit=len(chunk)) for chunk in chunks)
+    )
+    found: Dict[str, str] = {}
+    for result in results:
+        if "error" in result:
+            continue
+        for tag in result.get("results") or []:
+            category = _tag_category_name(tag)
+            for name in tag.get("names") or []:
+                found[name.lower()] = category
+    return found
 
 
 async def ensure_tags_batch(tags_with_categories: List[Tuple[str, str]]) -> None:
@@ -388,6 +549,29 @@ async def ensure_tags_batch(tags_with_categories: List[Tuple[str, str]]) -> None
     if not tags_with_categories:
         return
 
+    # Drop case-insensitive duplicates and fresh cache hits up front (first occurrence
+    # wins), so only tags that need an API call get a task
+    now = time.time()
+    unique: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    for name, cat in tags_with_categories:
+        key = (name.lower(), cat.lower())
+        if key not in unique and not _is_cached(*key, now):
+            unique[key] = (name, cat)
+    if not unique:
+        return
+
+    # Tags that already exist with the right category only need caching; one bulk
+    # search replaces the POST + GET that ensure_tag would spend on each of them
+    existing = await _lookup_existing_tags([name for name, _ in unique.values()])
+    verified = [pair for key, pair in unique.items() if existing.get(key[0]) == key[1]]
+    if verified:
+        for name, cat in verified:
+            _cache_tag(name, cat)
+        await _update_tag_cache_db_many(verified)
+        unique = {key: pair for key, pair in unique.items() if existing.get(key[0]) != key[1]}
+        if not unique:
+            return
+
     sem = asyncio.Semaphore(_TAG_CONCURRENCY)
 
     async def _limited(name: str, cat: str) -> None:
@@ -395,7 +579,7 @@ async def ensure_tags_batch(tags_with_categories: List[Tuple[str, str]]) -> None
             await ensure_tag(name, cat)
 
     await asyncio.gather(
-        *(_limited(n, c) for n, c in tags_with_categories)
+        *(_limited(n, c) for n, c in unique.values())
     )
 
 
@@ -445,6 +629,7 @@ async def download_post_content(post_id: int, dest_path: Path) -> Optional[Path]
     global _session
     if _session is None or _session.closed:
         await init_session()
+    await asyncio.to_thread(dest_path.parent.mkdir, parents=True, exist_ok=True)
     try:
         headers = _auth_headers()
         async with _session.get(
@@ -453,12 +638,12 @@ async def download_post_content(post_id: int, dest_path: Path) -> Optional[Path]
             if resp.status != 200:
                 logger.warning("Post %d content fetch failed: HTTP %s", post_id, resp.status)
                 return None
-            content = await resp.read()
+            async with aiofiles.open(dest_path, "wb") as f:
+                async for chunk in resp.content.iter_chunked(1024 * 1024):
+                    await f.write(chunk)
     except Exception as exc:
         logger.warning("Post %d content download failed: %s", post_id, exc)
         return None
-    dest_path.parent.mkdir(parents=True, exist_ok=True)
-    dest_path.write_bytes(content)
     return dest_path
 
 
@@ -489,7 +674,10 @@ async def update_post(
     if safety is not None:
         payload["safety"] = safety
 
-    return await _request("PUT", f"/api/post/{post_id}", json_payload=payload, timeout=30)
+    return await _with_retry(
+        lambda: _request("PUT", f"/api/post/{post_id}", json_payload=payload, timeout=30),
+        idempotent=False,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -502,14 +690,16 @@ async def reverse_search(file_path: Path) -> dict:
     Perform reverse image search to find exact and similar posts.
     Returns {"exactPost": {...} or None, "similarPosts": [...]} or {"error": ...}.
     """
-    data = aiohttp.FormData()
-    with open(file_path, "rb") as f:
-        file_bytes = f.read()
-
     mime_type = guess_mime_type(str(file_path))
-    data.add_field("content", file_bytes, filename=file_path.name, content_type=mime_type)
 
-    return await _request("POST", "/api/posts/reverse-search", form_data=data, timeout=60)
+    async def _attempt() -> dict:
+        # Streamed like upload_post, with a fresh form per attempt
+        data = aiohttp.FormData()
+        with open(file_path, "rb") as f:
+            data.add_field("content", f, filename=file_path.name, content_type=mime_type)
+            return await _request("POST", "/api/posts/reverse-search", form_data=data, timeout=60)
+
+    return await _with_retry(_attempt)
 
 
 # ---------------------------------------------------------------------------
@@ -5,7 +5,7 @@ Source names (author, circle, studio, etc.) are mapped in code to logical slots;
 each slot's Szurubooru category name comes from env (SZURU_CATEGORY_*).
 """
 
-import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from app.config import get_settings
@@ -23,7 +23,15 @@ SOURCE_NAMES_FOR_SLOT: Dict[str, List[str]] = {
     "meta": ["meta", "faults"],
 }
 
+_COMMA_TO_SPACE = str.maketrans(",", " ")
 
+
+def split_tag_string(raw: str) -> List[str]:
+    """Split a metadata tag string; tags are separated by commas and/or whitespace."""
+    return raw.translate(_COMMA_TO_SPACE).split()
+
+
+@lru_cache(maxsize=1)
 def get_szuru_categories() -> Tuple[str, ...]:
     """User's Szurubooru category names from env (so they can use e.g. Creator instead of artist)."""
     s = get_settings()
@@ -34,21 +42,28 @@ def get_szuru_categories() -> Tuple[str, ...]:
     return tuple(out)
 
 
-def _get_source_to_szuru_mapping() -> Dict[str, str]:
+@lru_cache(maxsize=256)
+def _slot_source_mapping(slot_categories: Tuple[str, ...]) -> Dict[str, str]:
     """
-    Build source_name -> user's Szurubooru category name.
-    Source names (author, circle, etc.) are fixed in SOURCE_NAMES_FOR_SLOT; env supplies the
-    category name the user's instance uses for each slot.
+    Build source_name -> category name, given one category name per slot (in SLOTS order).
+    Cached per distinct set of category names; callers must not mutate the result.
     """
-    s = get_settings()
     mapping: Dict[str, str] = {}
-    for slot in SLOTS:
-        user_cat = (getattr(s, f"szuru_category_{slot}", None) or "").strip() or slot
+    for slot, user_cat in zip(SLOTS, slot_categories):
         for source_name in SOURCE_NAMES_FOR_SLOT.get(slot, [slot]):
             mapping[source_name.lower()] = user_cat
     return mapping
 
 
+def _get_source_to_szuru_mapping() -> Dict[str, str]:
+    """
+    Build source_name -> user's Szurubooru category name.
+    Source names (author, circle, etc.) are fixed in SOURCE_NAMES_FOR_SLOT; env supplies the
+    category name the user's instance uses for each slot.
+    """
+    return _slot_source_mapping(get_szuru_categories())
+
+
 def resolve_categories(
     tag_names: List[str],
     metadata: Optional[dict] = None,
@@ -70,11 +85,9 @@ def resolve_categories(
     # Use per-user mappings if provided, otherwise fall back to ENV
     if user_category_mappings:
         # Build source_to_szuru mapping from user's settings
-        source_to_szuru: Dict[str, str] = {}
-        for slot in SLOTS:
-            user_cat = user_category_mappings.get(slot, slot)
-            for source_name in SOURCE_NAMES_FOR_SLOT.get(slot, [slot]):
-                source_to_szuru[source_name.lower()] = user_cat
+        source_to_szuru = _slot_source_mapping(
+            tuple(user_category_mappings.get(slot, slot) for slot in SLOTS)
+        )
         default = user_category_mappings.get("general", "general")
     else:
         # Fallback to "general" if not in user categories
@@ -114,9 +127,9 @@ def resolve_categories(
                     if key in result_lower:
                         result[result_lower[key]] = category
         elif isinstance(raw, str):
-            for part in re.split(r"[,\s]+", raw):
-                key = part.strip().lower()
-                if key and key in result_lower:
+            for part in split_tag_string(raw):
+                key = part.lower()
+                if key in result_lower:
                     result[result_lower[key]] = category
 
     return result
@@ -8,9 +8,10 @@ Centralises the logic for:
 - Handling the ``tagme`` sentinel
 """
 
-import json
 import re
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import orjson
 
 from app.services import tag_categories
 
@@ -33,12 +34,13 @@ def parse_category_prefix(raw: str) -> Tuple[Optional[str], str]:
     Returns ``(category, name)`` when a valid prefix is found,
     or ``(None, raw_stripped)`` otherwise.
     """
-    match = CATEGORY_PREFIX_RE.match(raw.strip())
+    raw = raw.strip()
+    match = CATEGORY_PREFIX_RE.match(raw)
     if match:
         cat, name = match.group(1).lower(), match.group(2).strip()
         if cat in VALID_CATEGORIES and name:
             return cat, name
-    return None, raw.strip()
+    return None, raw
 
 
 # ---------------------------------------------------------------------------
@@ -65,16 +67,18 @@ def parse_initial_tags(
         return all_tags, tags_from_source, client_tag_categories
 
     try:
-        initial = json.loads(initial_tags_json)
+        initial = orjson.loads(initial_tags_json)
         if not isinstance(initial, list):
             return all_tags, tags_from_source, client_tag_categories
-    except (json.JSONDecodeError, TypeError):
+    except (orjson.JSONDecodeError, TypeError):
         return all_tags, tags_from_source, client_tag_categories
 
     for t in initial:
-        if not isinstance(t, str) or not t.strip():
+        if not isinstance(t, str):
             continue
         raw = t.strip()
+        if not raw:
+            continue
         cat, name = parse_category_prefix(raw)
         if cat:
             all_tags.append(name)
@@ -92,22 +96,20 @@ def parse_initial_tags(
 # ---------------------------------------------------------------------------
 
 
-def _parse_metadata_tag_value(raw: object) -> List[str]:
-    """Parse a single metadata tag value (list, dict-with-name, dict-of-lists, or string) into tag names."""
-    out: List[str] = []
+def _iter_metadata_tag_value(raw: object) -> Iterator[str]:
+    """Yield tag names from a single metadata tag value (list, dict-with-name, dict-of-lists, or string)."""
     if isinstance(raw, list):
         for item in raw:
             if isinstance(item, str):
-                out.append(item)
+                yield item
             elif isinstance(item, dict) and "name" in item:
-                out.append(item["name"])
+                yield item["name"]
     elif isinstance(raw, dict):
         # e621 API returns tags as {category: [names]}; flatten all category lists
         for val in raw.values():
-            out.extend(_parse_metadata_tag_value(val))
+            yield from _iter_metadata_tag_value(val)
     elif isinstance(raw, str):
-        out.extend(t for t in re.split(r"[,\s]+", raw) if t.strip())
-    return out
+        yield from tag_categories.split_tag_string(raw)
 
 
 def extract_tags_from_metadata(metadata: dict) -> List[str]:
@@ -116,19 +118,19 @@ def extract_tags_from_metadata(metadata: dict) -> List[str]:
 
     Includes ``tags`` + all ``tags_*`` keys so categorized tags
     (artist, character, copyright) are present for ``resolve_categories``.
+    Returned names are stripped, non-empty and unique (case-insensitive).
     """
-    tags: List[str] = []
-    seen: Set[str] = set()
-    for key in metadata:
+    if not metadata:
+        return []
+    tags: Dict[str, str] = {}  # lowercased -> first stripped spelling
+    for key, raw in metadata.items():
         if key != "tags" and not key.startswith("tags_"):
             continue
-        raw = metadata.get(key)
-        for name in _parse_metadata_tag_value(raw):
-            key_lower = name.strip().lower()
-            if key_lower and key_lower not in seen:
-                seen.add(key_lower)
-                tags.append(name.strip())
-    return tags
+        for name in _iter_metadata_tag_value(raw):
+            name = name.strip()
+            if name:
+                tags.setdefault(name.lower(), name)
+    return list(tags.values())
 
 
 # ---------------------------------------------------------------------------
@@ -146,12 +148,10 @@ def normalize_category_prefixes(
     """
     normalized: List[str] = []
     for raw in tags:
-        cat, name = parse_category_prefix(raw)
+        cat, name = parse_category_prefix(raw)  # name comes back stripped either way
+        normalized.append(name)
         if cat:
-            normalized.append(name)
             categories[name.lower()] = cat
-        else:
-            normalized.append(raw.strip())
     return normalized, categories
 
 
@@ -161,7 +161,23 @@ def sanitize_tag(tag: str) -> str:
 
     Replaces whitespace with underscores (Szurubooru requires ``^\\S+$``).
     """
-    return re.sub(r"\s+", "_", tag.strip())
+    # split() drops leading/trailing whitespace and splits on runs of it
+    return "_".join(tag.split())
+
+
+def merge_tags(existing: List[str], new: List[str]) -> List[str]:
+    """
+    Return *existing* followed by the tags in *new* it doesn't already contain
+    (case-insensitive). Existing tags are kept as-is, duplicates included.
+    """
+    merged = list(existing)
+    present = {t.lower() for t in merged}
+    for tag in new:
+        key = tag.lower()
+        if key not in present:
+            present.add(key)
+            merged.append(tag)
+    return merged
 
 
 def deduplicate_tags(tags: List[str]) -> List[str]:
@@ -172,17 +188,11 @@ def deduplicate_tags(tags: List[str]) -> List[str]:
     removed when real tags exist, kept as sole tag when nothing else
     is present.
     """
-    seen: Set[str] = set()
-    unique: List[str] = []
+    unique: Dict[str, str] = {}  # lowercased -> first sanitized spelling
     for t in tags:
         sanitized = sanitize_tag(t)
-        key = sanitized.lower()
-        if key and key not in seen:
-            seen.add(key)
-            unique.append(sanitized)
-
-    if not unique:
-        return ["tagme"]
+        if sanitized:
+            unique.setdefault(sanitized.lower(), sanitized)
 
-    without_tagme = [t for t in unique if t.lower() != "tagme"]
-    return without_tagme if without_tagme else ["tagme"]
+    unique.pop("tagme", None)
+    return list(unique.values()) or ["tagme"]
@@ -1,7 +1,8 @@
 """
 WD14 Tagger using wdtagger.
 CPU: run in a subprocess (ProcessPoolExecutor) so PyTorch can use all cores without GIL.
-Optional batch tagging runs multiple images in parallel (thread pool).
+Batch tagging stacks up to WD14_BATCH_SIZE images into a single forward pass.
+Raw results are cached in Redis by (model, file SHA-256) so repeated images skip inference.
 """
 
 import asyncio
@@ -12,9 +13,13 @@ import shutil
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from redis.asyncio import Redis
 
 from app.config import get_settings
+from app.utils.hashing import sha256_file
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -47,24 +52,44 @@ def _process_pool_init(model_name: str) -> None:
     _worker_tagger = Tagger(model_repo=model_name)
 
 
+def _result_to_dict(result: Any) -> Dict[str, Any]:
+    """Convert a wdtagger result to a serializable dict (empty when there is no result)."""
+    if result is None:
+        return {}
+    return {
+        "general_tag_data": getattr(result, "general_tag_data", None) or {},
+        "character_tag_data": getattr(result, "character_tag_data", None) or {},
+        "rating_data": getattr(result, "rating_data", None) or {},
+    }
+
+
+def _tag_many(tagger: Any, path_strs: List[str]) -> List[Any]:
+    """Tag several images with one batched forward pass; always returns a list."""
+    results = tagger.tag(path_strs)
+    if not isinstance(results, list):
+        results = [results]
+    return results
+
+
 def _process_pool_tag(path_str: str) -> Dict[str, Any]:
     """Run in worker process: tag one image, return serializable dict."""
     global _worker_tagger
     if _worker_tagger is None:
         return {}
     try:
-        result = _worker_tagger.tag(path_str)
-        if result is None:
-            return {}
-        return {
-            "general_tag_data": getattr(result, "general_tag_data", None) or {},
-            "character_tag_data": getattr(result, "character_tag_data", None) or {},
-            "rating_data": getattr(result, "rating_data", None) or {},
-        }
+        return _result_to_dict(_worker_tagger.tag(path_str))
     except Exception:
         return {}
 
 
+def _process_pool_tag_batch(path_strs: List[str]) -> List[Dict[str, Any]]:
+    """Run in worker process: tag a batch of images in one forward pass."""
+    global _worker_tagger
+    if _worker_tagger is None:
+        return [{} for _ in path_strs]
+    return [_result_to_dict(r) for r in _tag_many(_worker_tagger, path_strs)]
+
+
 @dataclass
 class TagResult:
     """Parsed tagging result for a single image."""
@@ -205,6 +230,210 @@ def _use_process_pool() -> bool:
     return getattr(settings, "wd14_use_process_pool", True)
 
 
+# ---------------------------------------------------------------------------
+# Result cache (Redis, keyed by model + file content hash)
+# ---------------------------------------------------------------------------
+
+TAG_RESULT_CACHE_TTL_SECONDS = 30 * 24 * 3600  # 30 days
+
+_redis: Optional[Redis] = None
+
+
+def _get_redis() -> Redis:
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(settings.redis_url, decode_responses=True)
+    return _redis
+
+
+async def _cache_lookup(image_paths: List[Path]) -> Tuple[List[Optional[str]], List[Optional[Dict]]]:
+    """
+    Return ``(cache_keys, cached_raw_results)`` for *image_paths*.
+
+    Raw model confidences are cached (not thresholded tags) so live threshold /
+    max-tags changes still apply to cached entries. Any failure counts as a miss.
+    """
+    misses: List[Optional[Dict]] = [None] * len(image_paths)
+    try:
+        digests = await asyncio.to_thread(lambda: [sha256_file(p) for p in image_paths])
+    except OSError:
+        return [None] * len(image_paths), misses
+    keys: List[Optional[str]] = [f"wd14:{settings.wd14_model}:{d}" for d in digests]
+    try:
+        values = await _get_redis().mget(keys)
+    except Exception:
+        logger.debug("WD14 result cache lookup failed", exc_info=True)
+        return keys, misses
+    return keys, [orjson.loads(v) if v else None for v in values]
+
+
+async def _cache_store(keys: List[Optional[str]], raws: List[Dict]) -> None:
+    """Persist fresh raw results; empty results (failed inference) are not cached."""
+    pairs = [(k, r) for k, r in zip(keys, raws) if k and r]
+    if not pairs:
+        return
+    try:
+        async with _get_redis().pipeline(transaction=False) as pipe:
+            for key, raw in pairs:
+                # wdtagger scores may be numpy scalars
+                pipe.set(
+                    key,
+                    orjson.dumps(raw, option=orjson.OPT_SERIALIZE_NUMPY),
+                    ex=TAG_RESULT_CACHE_TTL_SECONDS,
+                )
+            await pipe.execute()
+    except Exception:
+        logger.debug("WD14 result cache store failed", exc_info=True)
+
+
+# ---------------------------------------------------------------------------
+# Inference
+# ---------------------------------------------------------------------------
+
+
+async def _infer_one(image_path: Path) -> Dict[str, Any]:
+    """
+    Run WD14 on one image and return the raw result dict (empty on failure).
+    On CPU with process pool: runs in subprocess so PyTorch can use all cores.
+    Otherwise: runs in dedicated thread pool.
+    """
+    path_str = str(Path(image_path).resolve())
+    try:
+        loop = asyncio.get_event_loop()
+        if _use_process_pool():
+            executor = _get_process_executor()
+            return await loop.run_in_executor(executor, _process_pool_tag, path_str)
+        await _ensure_tagger()
+        thread_exec = _get_thread_executor()
+        result = await loop.run_in_executor(thread_exec, lambda: _tagger.tag(path_str))
+        return _result_to_dict(result)
+    except Exception as exc:
+        logger.warning("WD14 tagger failed for %s: %s", image_path.name, exc)
+        return {}
+
+
+async def _infer_chunk(image_paths: List[Path]) -> List[Dict[str, Any]]:
+    """Run WD14 on one chunk of images with a single batched model call."""
+    path_strs = [str(Path(p).resolve()) for p in image_paths]
+    loop = asyncio.get_event_loop()
+    if _use_process_pool():
+        executor = _get_process_executor()
+        raw = await loop.run_in_executor(executor, _process_pool_tag_batch, path_strs)
+    else:
+        await _ensure_tagger()
+        thread_exec = _get_thread_executor()
+        raw = [
+            _result_to_dict(r)
+            for r in await loop.run_in_executor(thread_exec, _tag_many, _tagger, path_strs)
+        ]
+    if len(raw) != len(path_strs):
+        raise RuntimeError(f"expected {len(path_strs)} results, got {len(raw)}")
+    return raw
+
+
+async def _infer_many(image_paths: List[Path], batch_size: int) -> List[Dict[str, Any]]:
+    """
+    Run WD14 on *image_paths*, stacking up to *batch_size* images into one forward pass.
+
+    Chunks run concurrently on the executor. A chunk whose batched call fails
+    (e.g. one unreadable image) is retried image by image so one bad file does
+    not drop the tags of its neighbours. Results keep the order of *image_paths*.
+    """
+    chunks = [image_paths[i:i + batch_size] for i in range(0, len(image_paths), batch_size)]
+
+    async def _run(chunk: List[Path]) -> List[Dict[str, Any]]:
+        if len(chunk) == 1:
+            return [await _infer_one(chunk[0])]
+        try:
+            return await _infer_chunk(chunk)
+        except Exception as exc:
+            logger.warning("WD14 batch of %d failed (%s); tagging individually", len(chunk), exc)
+            return [await _infer_one(p) for p in chunk]
+
+    out: List[Dict[str, Any]] = []
+    for results in await asyncio.gather(*(_run(c) for c in chunks)):
+        out.extend(results)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Cross-job batching: images requested by concurrent workers share forward passes
+# ---------------------------------------------------------------------------
+
+INFER_COALESCE_SECONDS = 0.02  # how long a request waits for others to join its batch
+
+_pending_infer: List[Tuple[Path, int, "asyncio.Future[Dict[str, Any]]"]] = []
+_infer_flush: Optional[asyncio.Task] = None
+# Strong references to running flushes: _infer_flush is cleared before a flush is done
+_infer_flush_tasks: set = set()
+
+
+async def _infer_shared(image_paths: List[Path], batch_size: int) -> List[Dict[str, Any]]:
+    """
+    Like ``_infer_many`` but pooled with requests from other jobs.
+
+    Images queued within ``INFER_COALESCE_SECONDS`` of each other are inferred
+    together, so several workers tagging one image each still fill a batch.
+    """
+    global _infer_flush
+    loop = asyncio.get_running_loop()
+    futures = []
+    for path in image_paths:
+        fut = loop.create_future()
+        _pending_infer.append((path, batch_size, fut))
+        futures.append(fut)
+    if _infer_flush is None:
+        _infer_flush = asyncio.create_task(_flush_infer())
+        _infer_flush_tasks.add(_infer_flush)
+        _infer_flush.add_done_callback(_infer_flush_tasks.discard)
+    return list(await asyncio.gather(*futures))
+
+
+async def _flush_infer() -> None:
+    """Take everything queued so far, infer it in one go and hand results back."""
+    global _infer_flush, _pending_infer
+    await asyncio.sleep(INFER_COALESCE_SECONDS)
+    pending, _pending_infer = _pending_infer, []
+    _infer_flush = None  # later requests start the next batch
+    try:
+        results = await _infer_many(
+            [path for path, _, _ in pending], max(size for _, size, _ in pending)
+        )
+        for (_, _, fut), raw in zip(pending, results):
+            if not fut.done():  # requester may have been cancelled
+                fut.set_result(raw)
+    except Exception as exc:
+        for _, _, fut in pending:
+            if not fut.done():
+                fut.set_exception(exc)
+    finally:
+        # Only still-pending futures are affected, e.g. when this flush was cancelled
+        for _, _, fut in pending:
+            fut.cancel()
+
+
+async def _tag_raw(
+    image_paths: List[Path], batch_size: int, use_cache: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Raw WD14 results for *image_paths*, served from the result cache where possible.
+    With *use_cache* False (throwaway inputs such as video frames) the cache is neither
+    read nor written.
+    """
+    if not use_cache:
+        return [r or {} for r in await _infer_shared(image_paths, batch_size)]
+    keys, raws = await _cache_lookup(image_paths)
+    missing = [i for i, r in enumerate(raws) if r is None]
+    if missing:
+        fresh = await _infer_shared([image_paths[i] for i in missing], batch_size)
+        for i, raw in zip(missing, fresh):
+            raws[i] = raw
+        await _cache_store([keys[i] for i in missing], fresh)
+    if len(missing) < len(image_paths):
+        logger.debug("WD14 result cache: %d/%d hit(s)", len(image_paths) - len(missing), len(image_paths))
+    return [r or {} for r in raws]
+
+
 async def tag_image(
     image_path: Path,
     wd14_enabled: bool = True,
@@ -213,8 +442,7 @@ async def tag_image(
 ) -> TagResult:
     """
     Tag an image using WD14.
-    On CPU with process pool: runs in subprocess so PyTorch can use all cores.
-    Otherwise: runs in dedicated thread pool.
+    Results are cached by file content, so re-submitted images skip inference.
     """
     if not wd14_enabled:
         logger.debug("WD14 tagging disabled; skipping %s", image_path.name)
@@ -224,26 +452,10 @@ async def tag_image(
         logger.warning("WD14 Tagger not available; skipping %s", image_path.name)
         return TagResult()
 
-    path_str = str(Path(image_path).resolve())
-    try:
-        if _use_process_pool():
-            executor = _get_process_executor()
-            loop = asyncio.get_event_loop()
-            result_dict = await loop.run_in_executor(executor, _process_pool_tag, path_str)
-            if not result_dict:
-                return TagResult()
-            return _process_wdtagger_result(result_dict, confidence_threshold, max_tags)
-        else:
-            await _ensure_tagger()
-            loop = asyncio.get_event_loop()
-            thread_exec = _get_thread_executor()
-            result = await loop.run_in_executor(thread_exec, lambda: _tagger.tag(path_str))
-            if result is None:
-                return TagResult()
-            return _process_wdtagger_result(result, confidence_threshold, max_tags)
-    except Exception as exc:
-        logger.warning("WD14 tagger failed for %s: %s", image_path.name, exc)
+    raw = (await _tag_raw([image_path], 1))[0]
+    if not raw:
         return TagResult()
+    return _process_wdtagger_result(raw, confidence_threshold, max_tags)
 
 
 async def tag_images_batch(
@@ -251,24 +463,22 @@ async def tag_images_batch(
     wd14_enabled: bool = True,
     confidence_threshold: float = 0.35,
     max_tags: int = 30,
+    batch_size: Optional[int] = None,
+    use_cache: bool = True,
 ) -> List[TagResult]:
     """
-    Tag multiple images in parallel (like reference project).
-    When using thread pool, runs N tag() calls concurrently.
-    When using process pool (1 worker), runs one at a time but each uses all cores.
+    Tag multiple images, stacking up to *batch_size* of them into one forward pass.
+    Cached images are skipped (pass *use_cache* False for temporary files that will
+    never be seen again); results keep the order of *image_paths*.
     """
     if not image_paths or not wd14_enabled or not WD14_AVAILABLE:
         return [TagResult() for _ in image_paths]
-    tasks = [tag_image(p, wd14_enabled, confidence_threshold, max_tags) for p in image_paths]
-    raw = await asyncio.gather(*tasks, return_exceptions=True)
-    out: List[TagResult] = []
-    for r in raw:
-        if isinstance(r, Exception):
-            logger.warning("WD14 batch tag failed: %s", r)
-            out.append(TagResult())
-        else:
-            out.append(r)
-    return out
+    size = max(1, batch_size or settings.wd14_batch_size)
+    raws = await _tag_raw(image_paths, size, use_cache=use_cache)
+    return [
+        _process_wdtagger_result(raw, confidence_threshold, max_tags) if raw else TagResult()
+        for raw in raws
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -439,7 +649,10 @@ async def tag_video(
             return TagResult()
 
         logger.info("Tagging %d frames from video %s", len(frames), video_path.name)
-        frame_results = await tag_images_batch(frames, wd14_enabled, confidence_threshold, max_tags)
+        # Frames are temporary extractions; caching them would only fill Redis
+        frame_results = await tag_images_batch(
+            frames, wd14_enabled, confidence_threshold, max_tags, use_cache=False
+        )
 
         return _aggregate_frame_tags(
             frame_results,
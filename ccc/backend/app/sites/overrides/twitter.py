@@ -4,6 +4,9 @@ import re
 from typing import Optional
 from urllib.parse import urlparse
 
+_STATUS_RE = re.compile(r"/status/(\d+)", re.IGNORECASE)
+_MEDIA_RE = re.compile(r"/media/([A-Za-z0-9_-]+)", re.IGNORECASE)
+
 
 class TwitterOverride:
     """Mixin for Twitter-specific logic."""
@@ -14,12 +17,12 @@ class TwitterOverride:
         path = parsed.path.rstrip("/")
 
         if netloc in ("x.com", "twitter.com"):
-            m = re.search(r"/status/(\d+)", path, re.IGNORECASE)
+            m = _STATUS_RE.search(path)
             if m:
                 return f"x.com/status/{m.group(1)}"
 
         if netloc in ("pbs.twimg.com", "video.twimg.com"):
-            m = re.match(r"/media/([A-Za-z0-9_-]+)", path, re.IGNORECASE)
+            m = _MEDIA_RE.match(path)
             if m:
                 return f"twimg.com/media/{m.group(1)}"
 
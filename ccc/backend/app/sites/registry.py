@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Type
 
 from app.config import Settings, get_settings
@@ -14,6 +15,7 @@ logger = logging.getLogger(__name__)
 
 _HANDLER_CLASSES: List[Type[SiteHandler]] = []
 _initialized = False
+_DEFAULT_HANDLERS: List[SiteHandler] = []  # credential-less instances for URL helpers
 
 
 def _make_handler_class(defn: dict) -> Type[SiteHandler]:
@@ -33,7 +35,8 @@ def _make_handler_class(defn: dict) -> Type[SiteHandler]:
     gallery_dl_tag_options = [("tags", tags_value)] if tags_value else []
 
     def _matches_url(self, url: str) -> bool:
-        return any(d in url.lower() for d in domains)
+        url_lower = url.lower()
+        return any(d in url_lower for d in domains)
 
     attrs = {
         "name": sid,
@@ -135,9 +138,29 @@ def get_all_handlers(user_config: Optional[Dict[str, Dict[str, str]]] = None) ->
     return [handler_cls(settings, user_config) for handler_cls in _HANDLER_CLASSES]
 
 
+def _match_default_handler(url: str) -> Optional[SiteHandler]:
+    """
+    Like ``get_handler(url)`` but reuses handler instances built once.
+
+    URL matching and normalization never read credentials, so the hot URL helpers
+    below don't need a fresh instance of every handler class per call.
+    """
+    global _DEFAULT_HANDLERS
+    if not _DEFAULT_HANDLERS:
+        _init_handler_classes()
+        settings = get_settings()
+        _DEFAULT_HANDLERS = [handler_cls(settings) for handler_cls in _HANDLER_CLASSES]
+
+    for handler in _DEFAULT_HANDLERS:
+        if handler.matches_url(url):
+            return handler
+    return None
+
+
+@lru_cache(maxsize=1024)
 def normalize_url(url: str) -> str:
     """Run site-specific URL normalization. Falls through to identity if no handler matches."""
-    handler = get_handler(url)
+    handler = _match_default_handler(url)
     if handler:
         return handler.normalize_url(url)
     return url
@@ -145,7 +168,7 @@ def normalize_url(url: str) -> str:
 
 def normalize_url_for_comparison(url: str) -> Optional[str]:
     """Delegate to site handler for comparison normalization. Returns None if no site-specific logic."""
-    handler = get_handler(url)
+    handler = _match_default_handler(url)
     if handler:
         return handler.normalize_url_for_comparison(url)
     return None
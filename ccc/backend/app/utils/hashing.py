@@ -0,0 +1,37 @@
+"""
+Shared file hashing helpers.
+"""
+
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+
+@lru_cache(maxsize=256)
+def _file_digests(path: str, size: int, mtime_ns: int) -> Tuple[str, str]:
+    sha256 = hashlib.sha256()
+    sha1 = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+            sha1.update(chunk)
+    return sha256.hexdigest(), sha1.hexdigest()
+
+
+def file_digests(path: Path) -> Tuple[str, str]:
+    """
+    Return the hex ``(sha256, sha1)`` of *path* from a single read in 1 MiB chunks
+    (blocking; run in a thread).
+
+    Memoized per path, size and mtime, so the WD14 cache key and the upload's
+    duplicate checks share one read of each downloaded file.
+    """
+    st = os.stat(path)
+    return _file_digests(str(path), st.st_size, st.st_mtime_ns)
+
+
+def sha256_file(path: Path) -> str:
+    """Return the hex SHA-256 of *path* (blocking; run in a thread)."""
+    return file_digests(path)[0]
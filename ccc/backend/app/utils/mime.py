@@ -4,6 +4,7 @@ Ensures consistent type detection across the application, even in minimal Docker
 """
 
 import mimetypes
+import os
 
 # Initialize and patch the mimetypes database once at import time.
 mimetypes.init()
@@ -47,6 +48,10 @@ for ext, mime in COMMON_MIME_TYPES.items():
 
 def guess_mime_type(filename: str) -> str:
     """Guess MIME type from filename. Returns 'application/octet-stream' as fallback."""
+    # Common media extensions resolve with one dict lookup; mimetypes parses the whole name
+    mime = COMMON_MIME_TYPES.get(os.path.splitext(filename)[1].lower())
+    if mime:
+        return mime
     mime, _ = mimetypes.guess_type(filename)
     return mime or "application/octet-stream"
 
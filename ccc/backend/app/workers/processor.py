@@ -4,15 +4,21 @@ Polls the database for PENDING jobs and runs the download -> tag -> upload pipel
 """
 
 import asyncio
-import json
 import logging
 import os
+import re
 import shutil
-from datetime import datetime, timezone
+import time
+from collections import deque
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-from sqlalchemy import select
+import asyncpg
+import orjson
+from sqlalchemy import case, func, literal, select, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.database import Job, JobStatus, JobType, User, async_session
@@ -22,6 +28,7 @@ from app.services import sources as source_utils
 from app.services import tag_utils
 from app.services.config import load_user_config, load_global_config
 from app.services.encryption import decrypt
+from app.utils.hashing import file_digests
 from app.utils.mime import extension_from_content_type
 from app.sites.registry import normalize_url as _normalize_site_url
 from app.api.events import publish_job_update
@@ -33,10 +40,49 @@ settings = get_settings()
 _global_config = None
 
 # Mime-extension mapping for images (used to decide if WD14 tagging applies).
-IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tiff"}
-VIDEO_EXTENSIONS = {".mp4", ".webm", ".mkv", ".avi", ".mov"}
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tiff"})
+VIDEO_EXTENSIONS = frozenset({".mp4", ".webm", ".mkv", ".avi", ".mov"})
+_MEDIA_KIND_BY_EXT = {
+    **dict.fromkeys(IMAGE_EXTENSIONS, "image"),
+    **dict.fromkeys(VIDEO_EXTENSIONS, "video"),
+}
+
+# Max media items buffered between pipeline stages (download -> tag -> upload).
+_PIPELINE_DEPTH = 2
+
+# Longest error text stored on a job (error_message); SSE updates carry a shorter excerpt.
+_MAX_ERROR_LENGTH = 4000
+
+# Upload errors that mean the file is already on Szurubooru.
+_DUPLICATE_ERROR_RE = re.compile(r"already uploaded|duplicate|content checksum", re.IGNORECASE)
+
+# PostgreSQL channel notified by the jobs trigger (migration 019) when a job becomes PENDING.
+JOBS_NOTIFY_CHANNEL = "jobs_new"
+# Postgres NOTIFY channel for jobs paused/stopped externally (trigger in migration 022)
+JOBS_ABORT_NOTIFY_CHANNEL = "jobs_abort"
+# Idle poll interval while LISTEN is active (safety net only) and when it is not.
+_IDLE_POLL_LISTENING = 30
+_IDLE_POLL_FALLBACK = 2
+_LISTENER_RETRY_SECONDS = 60
 
 _running = True
+# One token wakes one idle worker; bounded so wake-ups never pile up beyond the worker count
+_job_wakeups: asyncio.Queue = asyncio.Queue(maxsize=max(1, settings.worker_concurrency))
+_listener_conn: Optional[asyncpg.Connection] = None
+_listener_lock = asyncio.Lock()
+_listener_retry_at = 0.0
+# Workers currently sleeping in _wait_for_job, and jobs claimed on their behalf
+_idle_workers = 0
+_claimed_jobs: deque = deque()
+# Job ids being processed in this process, and those whose pause/stop state must be
+# re-read from the database (NOTIFY received, or LISTEN was not up to see one)
+_active_jobs: set = set()
+_abort_check_pending: set = set()
+# Background deletions of finished job directories (kept referenced until done); capped
+# so a burst of finished galleries cannot occupy the default thread pool
+_CLEANUP_CONCURRENCY = 4
+_cleanup_tasks: set = set()
+_cleanup_sem = asyncio.Semaphore(_CLEANUP_CONCURRENCY)
 
 
 # ---------------------------------------------------------------------------
@@ -44,6 +90,23 @@ _running = True
 # ---------------------------------------------------------------------------
 
 
+@asynccontextmanager
+async def _session_scope(db: Optional[AsyncSession] = None) -> AsyncIterator[AsyncSession]:
+    """Yield *db* when the caller already holds a session, otherwise open a fresh one."""
+    if db is not None:
+        yield db
+        return
+    async with async_session() as new_db:
+        yield new_db
+
+
+def _media_kind(fp: Path) -> Optional[str]:
+    """Classify *fp* as ``"image"`` or ``"video"`` by extension (None if neither)."""
+    name = fp.name
+    dot = name.rfind(".")
+    return _MEDIA_KIND_BY_EXT.get(name[dot:].lower()) if dot > 0 else None
+
+
 def _looks_like_url(s: str) -> bool:
     return s.startswith("http://") or s.startswith("https://")
 
@@ -57,13 +120,17 @@ def _extract_metadata_sources(metadata: Dict) -> List[str]:
         sources = data.get("sources")
         if isinstance(sources, list):
             for s in sources:
-                if isinstance(s, str) and s.strip() and _looks_like_url(s.strip()):
-                    urls.append(s.strip())
+                if isinstance(s, str):
+                    s = s.strip()
+                    if _looks_like_url(s):
+                        urls.append(s)
     # Some extractors put a top-level "source" string (some extractors
     # use non-URL values like "removed", so filter those out)
     source = metadata.get("source")
-    if isinstance(source, str) and source.strip() and _looks_like_url(source.strip()):
-        urls.append(source.strip())
+    if isinstance(source, str):
+        source = source.strip()
+        if _looks_like_url(source):
+            urls.append(source)
     return urls
 
 
@@ -73,13 +140,21 @@ def _extract_metadata_sources(metadata: Dict) -> List[str]:
 
 
 INFLIGHT_STATUSES = (JobStatus.DOWNLOADING, JobStatus.TAGGING, JobStatus.UPLOADING)
+# Statuses set externally (API) that make a running job stop processing.
+ABORT_STATUSES = (JobStatus.PAUSED, JobStatus.STOPPED)
 
 
-async def _reset_inflight_jobs_on_startup() -> None:
+async def reset_inflight_jobs_on_startup() -> None:
     """
-    On worker startup, reset any jobs left in DOWNLOADING/TAGGING/UPLOADING (e.g. after
-    a container reboot) to PENDING so they get picked up again.
+    Reset any jobs left in DOWNLOADING/TAGGING/UPLOADING (e.g. after a container
+    reboot) to PENDING so they get picked up again, and finish deleting job
+    directories the previous run had set aside.
+
+    Must run once, before any worker starts: a reset that overlaps with claiming
+    would requeue jobs a worker has just claimed, and they would be processed twice.
     """
+    for trash in await asyncio.to_thread(_list_job_dir_trash, Path(settings.job_data_dir)):
+        _schedule_tree_delete(trash)
     async with async_session() as db:
         result = await db.execute(
             select(Job).where(Job.status.in_(INFLIGHT_STATUSES))
@@ -90,7 +165,7 @@ async def _reset_inflight_jobs_on_startup() -> None:
         for job in jobs:
             job.status = JobStatus.PENDING
             job.started_at = None
-            job.updated_at = datetime.now(timezone.utc)
+            job.updated_at = func.now()
         await db.commit()
         for job in jobs:
             await publish_job_update(job_id=job.id, status="pending", progress=0)
@@ -98,22 +173,23 @@ async def _reset_inflight_jobs_on_startup() -> None:
 
 
 async def start_worker(worker_id: int = 0) -> None:
-    """Main worker loop – polls for pending jobs."""
+    """Main worker loop – claims pending jobs, sleeping on LISTEN/NOTIFY when idle."""
     global _running
     _running = True
     tag = f"[W{worker_id}]"
     logger.info("%s Worker started.", tag)
 
-    await _reset_inflight_jobs_on_startup()
-
     while _running:
         try:
-            job = await _claim_next_job()
+            job = _claimed_jobs.popleft() if _claimed_jobs else await _claim_for_idle_workers()
             if job:
                 logger.info("%s Claimed job %s", tag, job.id)
                 await _process_job(job, tag)
+                # Loop straight back to claim: a backlog is likely, so never sleep after work
             else:
-                await asyncio.sleep(2)  # nothing to do – wait
+                # Nothing to do – wait for a NOTIFY (or poll if LISTEN is unavailable)
+                listening = await _ensure_job_listener()
+                await _wait_for_job(_IDLE_POLL_LISTENING if listening else _IDLE_POLL_FALLBACK)
         except asyncio.CancelledError:
             break
         except Exception:
@@ -122,8 +198,92 @@ async def start_worker(worker_id: int = 0) -> None:
 
 
 async def stop_worker() -> None:
-    global _running
+    global _running, _listener_conn
     _running = False
+    if _listener_conn is not None:
+        conn, _listener_conn = _listener_conn, None
+        try:
+            await conn.close()
+        except Exception:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Job notifications (LISTEN/NOTIFY)
+# ---------------------------------------------------------------------------
+
+
+def _wake_idle_workers(count: int = 1) -> None:
+    for _ in range(count):
+        try:
+            _job_wakeups.put_nowait(None)
+        except asyncio.QueueFull:
+            return  # every worker already has a wake-up pending
+
+
+def _on_job_notify(connection, pid, channel, payload) -> None:
+    # One new job needs one worker; waking them all would just make the rest
+    # run an empty claim query
+    _wake_idle_workers()
+
+
+def _on_job_abort_notify(connection, pid, channel, payload) -> None:
+    _abort_check_pending.add(payload)
+
+
+def _on_listener_closed(connection) -> None:
+    # Pause/stop notifications for running jobs may be missed until LISTEN is back
+    _abort_check_pending.update(_active_jobs)
+    # Wake all idle workers so they re-check the queue (catching anything missed while
+    # disconnected) and fall back to polling instead of sleeping out the poll interval.
+    _wake_idle_workers(_job_wakeups.maxsize)
+
+
+async def _ensure_job_listener() -> bool:
+    """
+    Make sure the shared LISTEN connection is open; returns True when listening.
+
+    One connection serves all workers in the process. After a failure, reconnects
+    are attempted at most every ``_LISTENER_RETRY_SECONDS``.
+    """
+    global _listener_conn, _listener_retry_at
+    async with _listener_lock:
+        if _listener_conn is not None and not _listener_conn.is_closed():
+            return True
+        _listener_conn = None
+        if time.monotonic() < _listener_retry_at:
+            return False
+        try:
+            dsn = make_url(settings.database_url).set(drivername="postgresql")
+            conn = await asyncpg.connect(dsn.render_as_string(hide_password=False))
+            await conn.add_listener(JOBS_NOTIFY_CHANNEL, _on_job_notify)
+            await conn.add_listener(JOBS_ABORT_NOTIFY_CHANNEL, _on_job_abort_notify)
+            conn.add_termination_listener(_on_listener_closed)
+        except Exception as exc:
+            _listener_retry_at = time.monotonic() + _LISTENER_RETRY_SECONDS
+            logger.warning("LISTEN %s unavailable, polling for jobs instead: %s",
+                           JOBS_NOTIFY_CHANNEL, exc)
+            return False
+        _listener_conn = conn
+        # Running jobs may have been paused while nobody was listening
+        _abort_check_pending.update(_active_jobs)
+        logger.debug("Listening for new jobs on channel %s", JOBS_NOTIFY_CHANNEL)
+        # A job queued after the caller's empty claim but before LISTEN took effect sent
+        # its NOTIFY to nobody; have the idle workers claim once more before sleeping
+        _wake_idle_workers(_job_wakeups.maxsize)
+        return True
+
+
+async def _wait_for_job(timeout: float) -> None:
+    """Sleep until this worker is woken for a job or *timeout* seconds pass."""
+    global _idle_workers
+    _idle_workers += 1
+    try:
+        await asyncio.wait_for(_job_wakeups.get(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        _idle_workers -= 1
 
 
 # ---------------------------------------------------------------------------
@@ -131,28 +291,57 @@ async def stop_worker() -> None:
 # ---------------------------------------------------------------------------
 
 
-async def _claim_next_job():
-    """Atomically grab the oldest PENDING job and mark it as DOWNLOADING."""
-    async with async_session() as db:
+async def _claim_for_idle_workers() -> Optional[Job]:
+    """
+    Claim a job for the calling worker plus one for each idle worker.
+
+    The extra jobs are queued in-process and those workers woken, so a burst of
+    new jobs costs one claim query rather than one per worker. Claims never
+    exceed the workers free to run them, so no job sits in DOWNLOADING unprocessed.
+    """
+    jobs = await _claim_jobs(1 + _idle_workers)
+    if not jobs:
+        return None
+    if len(jobs) > 1:
+        _claimed_jobs.extend(jobs[1:])
+        _wake_idle_workers(len(jobs) - 1)
+    return jobs[0]
+
+
+async def _claim_jobs(limit: int, db: Optional[AsyncSession] = None) -> List[Job]:
+    """
+    Atomically grab up to *limit* of the oldest PENDING jobs and mark them DOWNLOADING.
+
+    A single ``UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED) RETURNING``
+    both locks and claims the rows, so concurrent workers never get the same job.
+    Returned oldest first.
+    """
+    next_pending = (
+        select(Job.id)
+        .where(Job.status == JobStatus.PENDING)
+        .order_by(Job.created_at.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    async with _session_scope(db) as db:
         result = await db.execute(
-            select(Job)
-            .where(Job.status == JobStatus.PENDING)
-            .order_by(Job.created_at.asc())
-            .limit(1)
-            .with_for_update(skip_locked=True)
+            update(Job)
+            .where(Job.id.in_(next_pending))
+            .values(
+                status=JobStatus.DOWNLOADING,
+                updated_at=func.now(),
+                started_at=func.coalesce(Job.started_at, func.now()),
+            )
+            .returning(Job)
+            .execution_options(synchronize_session=False)
         )
-        job = result.scalar_one_or_none()
-        if job:
-            now = datetime.now(timezone.utc)
-            job.status = JobStatus.DOWNLOADING
-            job.updated_at = now
-            if job.started_at is None:
-                job.started_at = now
-            await db.commit()
-            await db.refresh(job)
+        # RETURNING order is unspecified; keep FIFO across the batch
+        jobs = sorted(result.scalars().all(), key=lambda j: j.created_at)
+        await db.commit()
+        for job in jobs:
             # Publish SSE update
             await publish_job_update(job_id=job.id, status="downloading", progress=25)
-        return job
+        return jobs
 
 
 async def _process_job(job: Job, tag: str = "[W0]") -> None:
@@ -161,17 +350,18 @@ async def _process_job(job: Job, tag: str = "[W0]") -> None:
 
     1. Load user-specific configuration from database
     2. Extract direct media URLs from the source
-    3. For each media: download, tag, upload
+    3. Download, tag, and upload each media (pipelined across media)
     4. Create relations between posts from multi-file sources
     """
-    job_dir = os.path.join(settings.job_data_dir, str(job.id))
-    os.makedirs(job_dir, exist_ok=True)
+    job_dir = Path(settings.job_data_dir) / str(job.id)
+    await asyncio.to_thread(job_dir.mkdir, parents=True, exist_ok=True)
 
     # Load configurations from database
     global _global_config
     user_config_obj = None
     user_config_dict = None
 
+    # One session is reused for every status update of this job (committed between steps)
     async with async_session() as db:
         # Load global configuration
         _global_config = await load_global_config(db)
@@ -208,86 +398,74 @@ async def _process_job(job: Job, tag: str = "[W0]") -> None:
             else:
                 logger.warning("%s Job %s: User %s not found in database", tag, job.id, job.szuru_user)
 
-    # Set current user context for Szurubooru API calls (with decrypted credentials and URL)
-    set_current_user(job.szuru_user, szuru_token, szuru_url)
-
-    # Snapshot retry policy from global config (DB-backed)
-    max_retries = _global_config.max_retries
-    retry_delay = _global_config.retry_delay
-
-    try:
-        if await _abort_if_paused_or_stopped(job):
-            return
+        # End the read transaction so the connection is not held during downloads
+        await db.commit()
 
-        # ---- Phase 1: Extract media URLs ----
-        extracted_media = await _extract_media(job, job_dir, user_config_dict)
-        if extracted_media is None:
-            return  # already failed
+        # Set current user context for Szurubooru API calls (with decrypted credentials and URL)
+        set_current_user(job.szuru_user, szuru_token, szuru_url)
 
-        # ---- Phase 2: Process each media file ----
-        created_posts: List[dict] = []
-        all_sources: List[str] = []
-        last_error: Optional[str] = None
+        # Snapshot retry policy from global config (DB-backed)
+        max_retries = _global_config.max_retries
+        retry_delay = _global_config.retry_delay
 
-        for idx, media in enumerate(extracted_media):
-            logger.info("%s Job %s: Processing media %d/%d - %s",
-                        tag, job.id, idx + 1, len(extracted_media), media.filename)
-            media_dir = os.path.join(job_dir, f"media_{idx}")
-            os.makedirs(media_dir, exist_ok=True)
+        job_key = str(job.id)
+        _active_jobs.add(job_key)
+        # The first check always reads the database
+        _abort_check_pending.add(job_key)
+        try:
+            if await _abort_if_paused_or_stopped(job, db):
+                return
 
-            try:
-                if await _abort_if_paused_or_stopped(job):
-                    return
+            # ---- Phase 1: Extract media URLs ----
+            extracted_media = await _extract_media(job, job_dir, user_config_dict, db)
+            if extracted_media is None:
+                return  # already failed
 
-                post_info = await _process_single_media(job, media, media_dir, user_config_dict, user_category_mappings)
-                if post_info:
-                    created_posts.append(post_info)
-                    all_sources.append(media.source_url)
-                elif post_info is None:
-                    # Abort returned None too — don't treat pause/stop as failure
-                    if await _abort_if_paused_or_stopped(job):
-                        return
-                    last_error = f"Failed to process {media.filename}"
-            except Exception as exc:
-                logger.exception("%s Job %s: Failed to process media %d (%s)",
-                                 tag, job.id, idx, media.filename)
-                last_error = str(exc)
-
-        # ---- Phase 3: Create relations ----
-        if len(created_posts) > 1:
-            await _create_relations(job, created_posts)
-
-        # ---- Finalise ----
-        if created_posts:
-            primary = created_posts[0]
-            related_ids = [p["post"]["id"] for p in created_posts[1:]]
-            await _complete_job(
-                job,
-                primary["post"]["id"],
-                primary["tags"],
-                primary["tags_from_source"],
-                primary["tags_from_ai"],
-                related_post_ids=related_ids,
-                stored_sources=primary.get("final_source"),
-                was_merge=primary.get("merged", False),
-                safety=primary.get("safety"),
+            # ---- Phase 2: Download, tag and upload each media file (pipelined) ----
+            created_posts, last_error, aborted = await _run_media_pipeline(
+                job, extracted_media, job_dir, user_config_dict, user_category_mappings, db, tag
             )
-        elif last_error:
-            await _fail_job(job, last_error, max_retries=max_retries, retry_delay=retry_delay)
-        else:
-            await _fail_job(job, "No posts created.", max_retries=max_retries, retry_delay=retry_delay)
-
-    except Exception as exc:
-        logger.exception("%s Job %s failed", tag, job.id)
-        # Don't overwrite PAUSED/STOPPED status with a failure
-        if not await _abort_if_paused_or_stopped(job):
-            await _fail_job(job, str(exc), max_retries=max_retries, retry_delay=retry_delay)
-    finally:
-        try:
-            if os.path.isdir(job_dir):
-                shutil.rmtree(job_dir, ignore_errors=True)
-        except Exception:
-            pass
+            if aborted:
+                return
+
+            # ---- Phase 3: Create relations ----
+            if len(created_posts) > 1:
+                await _create_relations(job, created_posts)
+
+            # ---- Finalise ----
+            if created_posts:
+                primary = created_posts[0]
+                related_ids = [p["post"]["id"] for p in created_posts[1:]]
+                await _complete_job(
+                    job,
+                    primary["post"]["id"],
+                    primary["tags"],
+                    primary["tags_from_source"],
+                    primary["tags_from_ai"],
+                    related_post_ids=related_ids,
+                    stored_sources=primary.get("final_source"),
+                    was_merge=primary.get("merged", False),
+                    safety=primary.get("safety"),
+                    db=db,
+                )
+            elif last_error:
+                await _fail_job(job, last_error, max_retries=max_retries, retry_delay=retry_delay, db=db)
+            else:
+                await _fail_job(job, "No posts created.", max_retries=max_retries, retry_delay=retry_delay, db=db)
+
+        except Exception as exc:
+            logger.exception("%s Job %s failed", tag, job.id)
+            # Discard any half-finished transaction before reusing the session
+            await db.rollback()
+            # _fail_job leaves a PAUSED/STOPPED job alone
+            await _fail_job(job, str(exc), max_retries=max_retries, retry_delay=retry_delay, db=db)
+        finally:
+            _active_jobs.discard(job_key)
+            _abort_check_pending.discard(job_key)
+            try:
+                await _remove_job_dir(job_dir)
+            except Exception:
+                pass
 
 
 # ---------------------------------------------------------------------------
@@ -296,7 +474,10 @@ async def _process_job(job: Job, tag: str = "[W0]") -> None:
 
 
 async def _extract_media(
-    job: Job, job_dir: str, user_config: Optional[Dict] = None
+    job: Job,
+    job_dir: Path,
+    user_config: Optional[Dict] = None,
+    db: Optional[AsyncSession] = None,
 ) -> Optional[List[downloader.ExtractedMedia]]:
     """
     Phase 1: Determine the list of media items to process.
@@ -317,12 +498,12 @@ async def _extract_media(
     if job.job_type == JobType.TAG_EXISTING:
         target_id = getattr(job, "target_szuru_post_id", None)
         if target_id is None:
-            await _fail_job(job, "Tag job has no target_szuru_post_id.")
+            await _fail_job(job, "Tag job has no target_szuru_post_id.", db=db)
             return None
         logger.info("Job %s: Phase 1 - Downloading post %d content from Szurubooru", job.id, target_id)
         post = await szurubooru.get_post(target_id)
         if "error" in post:
-            await _fail_job(job, f"Failed to get post {target_id}: {post.get('error', 'unknown')}")
+            await _fail_job(job, f"Failed to get post {target_id}: {post.get('error', 'unknown')}", db=db)
             return None
         mime = (post.get("mimeType") or "").strip() or "application/octet-stream"
         ext = extension_from_content_type(mime) or "bin"
@@ -330,10 +511,10 @@ async def _extract_media(
             ext = f".{ext}"
         else:
             ext = ".bin"
-        dest_path = Path(job_dir) / f"content{ext}"
+        dest_path = job_dir / f"content{ext}"
         saved = await szurubooru.download_post_content(target_id, dest_path)
         if not saved:
-            await _fail_job(job, f"Failed to download content for post {target_id}")
+            await _fail_job(job, f"Failed to download content for post {target_id}", db=db)
             return None
         return [downloader.ExtractedMedia(
             url=f"file://{saved.name}",
@@ -342,55 +523,277 @@ async def _extract_media(
             metadata=None,
         )]
 
-    # FILE job – file was already saved during upload
-    for fn in os.listdir(job_dir):
-        fp = Path(job_dir) / fn
-        if fp.is_file() and not fn.endswith(".json"):
-            return [downloader.ExtractedMedia(
-                url=f"file://{fn}",
-                source_url=f"file://{fn}",
-                filename=fn,
-                metadata=None,
-            )]
-
-    await _fail_job(job, "No files found in job directory.")
+    # FILE job – file was already saved during upload, under its original name
+    # (same fallback as the upload endpoint); scan the dir only if it isn't there
+    fn = job.original_filename or "upload"
+    if os.path.basename(fn) != fn or not await asyncio.to_thread((job_dir / fn).is_file):
+        uploaded = await asyncio.to_thread(_list_job_files, job_dir)
+        fn = uploaded[0].name if uploaded else None
+    if fn:
+        return [downloader.ExtractedMedia(
+            url=f"file://{fn}",
+            source_url=f"file://{fn}",
+            filename=fn,
+            metadata=None,
+        )]
+
+    await _fail_job(job, "No files found in job directory.", db=db)
     return None
 
 
-async def _process_single_media(
-    job: Job,
-    media: downloader.ExtractedMedia,
-    media_dir: str,
-    user_config: Optional[Dict] = None,
-    user_category_mappings: Optional[Dict] = None,
-) -> Optional[dict]:
+async def _remove_job_dir(job_dir: Path) -> None:
     """
-    Download, tag, and upload a single media item.
+    Delete *job_dir* without holding up the worker.
 
-    Returns a dict ``{"post": ..., "tags": ..., "tags_from_source": ..., "tags_from_ai": ...}``
-    on success, or None on failure.
+    The directory is renamed aside first (a single cheap call), so a retry of the job can
+    recreate it at once; the recursive delete of large galleries then runs in the background.
     """
-    # ---- Download ----
-    files, metadata = await _download_media(job, media, media_dir, user_config)
-    if not files:
-        logger.warning("Job %s: No files downloaded for %s", job.id, media.filename)
-        return None
+    trash = job_dir.with_name(f".{job_dir.name}.{time.monotonic_ns()}.deleting")
+    try:
+        await asyncio.to_thread(job_dir.rename, trash)
+    except FileNotFoundError:
+        return
+    except OSError:
+        await asyncio.to_thread(shutil.rmtree, job_dir, ignore_errors=True)
+        return
+    _schedule_tree_delete(trash)
 
-    fp = files[0]
 
-    if await _abort_if_paused_or_stopped(job):
-        return None  # caller checks too
+def _schedule_tree_delete(path: Path) -> None:
+    """Delete *path* recursively in the background, at most ``_CLEANUP_CONCURRENCY`` at once."""
+    async def _delete() -> None:
+        async with _cleanup_sem:
+            await asyncio.to_thread(shutil.rmtree, path, ignore_errors=True)
 
-    # ---- Tag ----
-    await _set_status(job, JobStatus.TAGGING)
-    tag_result = await _tag_file(job, fp, metadata, user_category_mappings)
+    task = asyncio.create_task(_delete())
+    _cleanup_tasks.add(task)
+    task.add_done_callback(_cleanup_tasks.discard)
+
+
+def _list_job_dir_trash(data_dir: Path) -> List[Path]:
+    """Return job directories renamed aside by ``_remove_job_dir`` (blocking; run in a thread)."""
+    try:
+        with os.scandir(data_dir) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith(".") and entry.name.endswith(".deleting")
+            ]
+    except FileNotFoundError:
+        return []
 
-    if await _abort_if_paused_or_stopped(job):
-        return None
 
-    # ---- Upload ----
-    await _set_status(job, JobStatus.UPLOADING)
-    return await _upload_file(job, fp, media, tag_result, metadata)
+def _list_job_files(job_dir: Path) -> List[Path]:
+    """Return the regular, non-JSON files directly inside *job_dir* (blocking; run in a thread)."""
+    with os.scandir(job_dir) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file(follow_symlinks=False) and not entry.name.endswith(".json")
+        ]
+
+
+async def _run_media_pipeline(
+    job: Job,
+    extracted_media: List[downloader.ExtractedMedia],
+    job_dir: Path,
+    user_config: Optional[Dict],
+    user_category_mappings: Optional[Dict],
+    db: AsyncSession,
+    tag: str = "[W0]",
+) -> Tuple[List[dict], Optional[str], bool]:
+    """
+    Download, tag, and upload every media item as three overlapping stages.
+
+    Stages are connected by bounded queues so the next files download while the
+    current one is being tagged, and tagging continues while earlier files upload.
+    Up to ``MEDIA_DOWNLOAD_CONCURRENCY`` downloads run at once; items reach the tag
+    stage in completion order and are put back in order at the end.
+    Images already waiting for the tag stage are tagged together in one WD14 batch,
+    and up to ``MEDIA_UPLOAD_CONCURRENCY`` uploads run at once.
+    The job session is shared between stages, guarded by a lock.
+
+    Returns ``(created_posts, last_error, aborted)``; ``created_posts`` keeps the
+    order of *extracted_media*.
+    """
+    db_lock = asyncio.Lock()
+    # Downloads may run ahead by up to one WD14 batch so the tag stage can batch them
+    to_tag: asyncio.Queue = asyncio.Queue(maxsize=max(_PIPELINE_DEPTH, settings.wd14_batch_size))
+    to_upload: asyncio.Queue = asyncio.Queue(maxsize=_PIPELINE_DEPTH)
+    posts: Dict[int, dict] = {}
+    errors: Dict[int, str] = {}
+    aborted = False
+
+    async def _check_abort() -> bool:
+        nonlocal aborted
+        if not aborted:
+            async with db_lock:
+                aborted = await _abort_if_paused_or_stopped(job, db)
+        return aborted
+
+    # Stages overlap across media, so the job status only ever moves forward:
+    # TAGGING when the first batch is tagged, UPLOADING when the first upload starts
+    stage_order = (JobStatus.TAGGING, JobStatus.UPLOADING)
+    stage_reached = -1
+
+    async def _enter_stage(status: JobStatus) -> bool:
+        """
+        Move the job to *status* unless it is already there or further along (then only
+        check for a pause). False (and aborted) if it was paused/stopped meanwhile.
+        """
+        nonlocal aborted, stage_reached
+        rank = stage_order.index(status)
+        if not aborted:
+            async with db_lock:
+                if rank > stage_reached:
+                    aborted = not await _set_status(job, status, db)
+                    stage_reached = rank
+                else:
+                    aborted = await _abort_if_paused_or_stopped(job, db)
+        return not aborted
+
+    def _media_dir(idx: int) -> Path:
+        return job_dir / f"media_{idx}"
+
+    async def _discard_media(idx: int) -> None:
+        # Free disk as soon as a media is done with; job_dir is still removed at job end
+        await asyncio.to_thread(shutil.rmtree, _media_dir(idx), ignore_errors=True)
+
+    download_sem = asyncio.Semaphore(max(1, settings.media_download_concurrency))
+
+    async def _download_one(idx: int, media: downloader.ExtractedMedia) -> None:
+        # The slot is held until the item is queued, so a full tag queue stalls new downloads
+        try:
+            logger.info("%s Job %s: Processing media %d/%d - %s",
+                        tag, job.id, idx + 1, len(extracted_media), media.filename)
+            media_dir = _media_dir(idx)
+            await asyncio.to_thread(media_dir.mkdir, exist_ok=True)
+            try:
+                files, metadata = await _download_media(job, media, str(media_dir), user_config)
+            except Exception as exc:
+                logger.exception("%s Job %s: Failed to download media %d (%s)",
+                                 tag, job.id, idx, media.filename)
+                errors[idx] = str(exc)
+                await _discard_media(idx)
+                return
+            if not files:
+                logger.warning("Job %s: No files downloaded for %s", job.id, media.filename)
+                errors[idx] = f"Failed to process {media.filename}"
+                await _discard_media(idx)
+                return
+            await to_tag.put((idx, media, files[0], metadata))
+        finally:
+            download_sem.release()
+
+    async def _download_stage() -> None:
+        downloads: List[asyncio.Task] = []
+        try:
+            for idx, media in enumerate(extracted_media):
+                await download_sem.acquire()
+                if await _check_abort():
+                    download_sem.release()
+                    break
+                downloads.append(asyncio.create_task(_download_one(idx, media)))
+            await asyncio.gather(*downloads)
+        finally:
+            for task in downloads:
+                task.cancel()
+        await to_tag.put(None)
+
+    async def _tag_stage() -> None:
+        finished = False
+        while not finished:
+            item = await to_tag.get()
+            if item is None:
+                break
+            batch = [item]
+            while len(batch) < settings.wd14_batch_size and not to_tag.empty():
+                item = to_tag.get_nowait()
+                if item is None:
+                    finished = True
+                    break
+                batch.append(item)
+            # Keep draining after an abort so the download stage never blocks on put()
+            try:
+                if not await _enter_stage(JobStatus.TAGGING):
+                    continue
+                wd14_results = await _tag_images(job, [fp for _, _, fp, _ in batch])
+            except Exception as exc:
+                logger.exception("%s Job %s: Failed to tag %d media", tag, job.id, len(batch))
+                for idx, *_ in batch:
+                    errors[idx] = str(exc)
+                continue
+            # Videos are frame-tagged in _tag_file; run the batch's items concurrently
+            tag_results = await asyncio.gather(
+                *(
+                    _tag_file(job, fp, metadata, user_category_mappings, wd14_results.get(fp))
+                    for _, _, fp, metadata in batch
+                ),
+                return_exceptions=True,
+            )
+            for (idx, media, fp, metadata), tag_result in zip(batch, tag_results):
+                if isinstance(tag_result, Exception):
+                    logger.error("%s Job %s: Failed to tag media %d (%s)",
+                                 tag, job.id, idx, media.filename, exc_info=tag_result)
+                    errors[idx] = str(tag_result)
+                    continue
+                await to_upload.put((idx, media, fp, metadata, tag_result))
+        await to_upload.put(None)
+
+    upload_sem = asyncio.Semaphore(max(1, settings.media_upload_concurrency))
+    page_sources = _job_page_sources(job)
+
+    async def _upload_one(idx, media, fp, metadata, tag_result) -> None:
+        try:
+            post_info = await _upload_file(job, fp, media, tag_result, metadata, page_sources)
+        except Exception as exc:
+            logger.exception("%s Job %s: Failed to upload media %d (%s)",
+                             tag, job.id, idx, media.filename)
+            errors[idx] = str(exc)
+            return
+        finally:
+            upload_sem.release()
+            await _discard_media(idx)
+        if post_info:
+            posts[idx] = post_info
+        elif not await _check_abort():
+            # Don't treat pause/stop as failure
+            errors[idx] = f"Failed to process {media.filename}"
+
+    async def _upload_stage() -> None:
+        uploads: List[asyncio.Task] = []
+        try:
+            while (item := await to_upload.get()) is not None:
+                try:
+                    if not await _enter_stage(JobStatus.UPLOADING):
+                        continue
+                except Exception as exc:
+                    logger.exception("%s Job %s: Failed to start upload of media %d", tag, job.id, item[0])
+                    errors[item[0]] = str(exc)
+                    continue
+                # Acquired here (released by _upload_one) so a full upload slot
+                # set backs up the queue instead of spawning unbounded tasks
+                await upload_sem.acquire()
+                uploads.append(asyncio.create_task(_upload_one(*item)))
+            await asyncio.gather(*uploads)
+        finally:
+            for task in uploads:
+                task.cancel()
+
+    stages = [
+        asyncio.create_task(_download_stage()),
+        asyncio.create_task(_tag_stage()),
+        asyncio.create_task(_upload_stage()),
+    ]
+    try:
+        await asyncio.gather(*stages)
+    finally:
+        for task in stages:
+            task.cancel()
+
+    created_posts = [posts[i] for i in sorted(posts)]
+    last_error = errors[max(errors)] if errors else None
+    return created_posts, last_error, aborted
 
 
 async def _download_media(
@@ -402,8 +805,7 @@ async def _download_media(
     """Download a single media item. Returns ``(files, metadata)``."""
     if job.job_type != JobType.URL:
         # FILE job — file already exists in the parent job_dir
-        job_dir = os.path.join(settings.job_data_dir, str(job.id))
-        return [Path(job_dir) / media.filename], {}
+        return [Path(settings.job_data_dir) / str(job.id) / media.filename], {}
 
     gallery_dl_timeout = _global_config.gallery_dl_timeout if _global_config else 120
     ytdlp_timeout = _global_config.ytdlp_timeout if _global_config else 300
@@ -426,54 +828,89 @@ async def _download_media(
             gallery_dl_timeout=gallery_dl_timeout, ytdlp_timeout=ytdlp_timeout,
         )
 
-    merged_meta = {**(media.metadata or {}), **dl.metadata}
-    return dl.files, merged_meta
+    # Only copy when both sides have keys (direct downloads return no metadata)
+    if not dl.metadata:
+        return dl.files, media.metadata or {}
+    if not media.metadata:
+        return dl.files, dl.metadata
+    return dl.files, {**media.metadata, **dl.metadata}
+
+
+async def _tag_images(job: Job, files: List[Path]) -> Dict[Path, tagger.TagResult]:
+    """
+    Run WD14 on all image *files* in one batched call.
+
+    Returns ``{path: TagResult}`` for the images that were tagged; videos, and
+    every file of a ``skip_tagging`` job, are left out.
+    """
+    if job.skip_tagging:
+        return {}
+    images = [fp for fp in files if _media_kind(fp) == "image"]
+    if not images:
+        return {}
+    results = await tagger.tag_images_batch(
+        images,
+        wd14_enabled=_global_config.wd14_enabled if _global_config else True,
+        confidence_threshold=_global_config.wd14_confidence_threshold if _global_config else 0.35,
+        max_tags=_global_config.wd14_max_tags if _global_config else 30,
+    )
+    return dict(zip(images, results))
 
 
-async def _tag_file(job: Job, fp: Path, metadata: Dict, user_category_mappings: Optional[Dict] = None) -> dict:
+async def _tag_file(
+    job: Job,
+    fp: Path,
+    metadata: Dict,
+    user_category_mappings: Optional[Dict] = None,
+    wd14_result: Optional[tagger.TagResult] = None,
+) -> dict:
     """
     Collect tags from all sources (initial, metadata, WD14) and return a dict with:
 
     ``all_tags``, ``tags_from_source``, ``tags_from_ai``, ``safety``,
-    ``client_tag_categories``, ``wd14_character_tags``, ``tag_to_category``.
+    ``wd14_character_tags`` and ``tags_with_categories`` (``(name, category)``
+    pairs still to be ensured in Szurubooru).
+
+    *wd14_result* is a precomputed WD14 result for an image (see ``_tag_images``);
+    when omitted, the image is tagged here.
     """
     # Parse initial (client-submitted) tags
     all_tags, tags_from_source, client_tag_categories = tag_utils.parse_initial_tags(
         job.initial_tags
     )
+    # Initial tags already had their category prefixes stripped above
+    initial_count = len(all_tags)
 
     # Metadata tags
     if metadata:
-        for t in tag_utils.extract_tags_from_metadata(metadata):
-            if t.strip():
-                all_tags.append(t.strip())
-                tags_from_source.append(t.strip())
+        metadata_tags = tag_utils.extract_tags_from_metadata(metadata)
+        all_tags.extend(metadata_tags)
+        tags_from_source.extend(metadata_tags)
 
     # WD14 tagging for images
     tags_from_ai: List[str] = []
     wd14_character_tags: set = set()
     safety = job.safety or "unsafe"
-    ext = fp.suffix.lower()
+    kind = _media_kind(fp)
 
     wd14_enabled = _global_config.wd14_enabled if _global_config else True
     wd14_confidence = _global_config.wd14_confidence_threshold if _global_config else 0.35
     wd14_max_tags = _global_config.wd14_max_tags if _global_config else 30
 
-    if ext in IMAGE_EXTENSIONS and not job.skip_tagging:
-        wd14 = await tagger.tag_image(
+    if kind == "image" and not job.skip_tagging:
+        wd14 = wd14_result if wd14_result is not None else await tagger.tag_image(
             fp,
             wd14_enabled=wd14_enabled,
             confidence_threshold=wd14_confidence,
             max_tags=wd14_max_tags,
         )
-        for t in wd14.general_tags + wd14.character_tags:
-            if t.strip():
-                all_tags.append(t.strip())
-                tags_from_ai.append(t.strip())
+        ai_tags = [t for t in map(str.strip, wd14.general_tags + wd14.character_tags) if t]
+        all_tags.extend(ai_tags)
+        tags_from_ai.extend(ai_tags)
         wd14_character_tags.update(wd14.character_tags)
         if wd14.safety:
             safety = wd14.safety
-    elif ext in VIDEO_EXTENSIONS:
+    elif kind == "video":
         all_tags.append("video")
         tags_from_source.append("video")
 
@@ -488,19 +925,18 @@ async def _tag_file(job: Job, fp: Path, metadata: Dict, user_category_mappings:
                 max_frames=_global_config.video_max_frames,
                 min_frame_ratio=_global_config.video_tag_min_frame_ratio,
             )
-            for t in wd14.general_tags + wd14.character_tags:
-                if t.strip():
-                    all_tags.append(t.strip())
-                    tags_from_ai.append(t.strip())
+            ai_tags = [t for t in map(str.strip, wd14.general_tags + wd14.character_tags) if t]
+            all_tags.extend(ai_tags)
+            tags_from_ai.extend(ai_tags)
             wd14_character_tags.update(wd14.character_tags)
             if wd14.safety:
                 safety = wd14.safety
 
-    # Normalize category prefixes and deduplicate
-    all_tags, client_tag_categories = tag_utils.normalize_category_prefixes(
-        all_tags, client_tag_categories
+    # Normalize category prefixes of metadata/AI tags and deduplicate
+    extra_tags, client_tag_categories = tag_utils.normalize_category_prefixes(
+        all_tags[initial_count:], client_tag_categories
     )
-    all_tags = tag_utils.deduplicate_tags(all_tags)
+    all_tags = tag_utils.deduplicate_tags(all_tags[:initial_count] + extra_tags)
 
     # Resolve tag categories (using per-user mappings if available)
     tag_to_category = tag_categories.resolve_categories(
@@ -509,18 +945,14 @@ async def _tag_file(job: Job, fp: Path, metadata: Dict, user_category_mappings:
     mappings = user_category_mappings or {}
     for t in wd14_character_tags:
         tag_to_category[t] = mappings.get("character", "character")
+
+    # Client-supplied categories win; applied while building the final list in one pass.
+    # Tags are ensured in Szurubooru by _upload_file, overlapped with its duplicate lookup
+    tags_with_categories: List[Tuple[str, str]] = []
     for tag in all_tags:
-        tag_lower = tag.strip().lower()
-        if tag_lower in client_tag_categories:
-            slot = client_tag_categories[tag_lower]
-            tag_to_category[tag] = mappings.get(slot, slot)
-
-    # Ensure all tags exist in Szurubooru with correct categories (concurrent)
-    tags_with_categories = [
-        (tag, tag_to_category.get(tag) or "general")
-        for tag in all_tags
-    ]
-    await szurubooru.ensure_tags_batch(tags_with_categories)
+        slot = client_tag_categories.get(tag.lower())  # already stripped/sanitized by deduplicate_tags
+        category = mappings.get(slot, slot) if slot else tag_to_category.get(tag)
+        tags_with_categories.append((tag, category or "general"))
 
     return {
         "all_tags": all_tags,
@@ -528,30 +960,52 @@ async def _tag_file(job: Job, fp: Path, metadata: Dict, user_category_mappings:
         "tags_from_ai": tags_from_ai,
         "safety": safety,
         "wd14_character_tags": wd14_character_tags,
+        "tags_with_categories": tags_with_categories,
     }
 
 
+def _job_page_sources(job: Job) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return the per-job parts of a post's source: ``(override, normalized page URL)``.
+
+    FILE jobs have no meaningful page URL.
+    """
+    primary_source = (job.source_override or "").strip() or None
+    if job.job_type == JobType.URL and job.url:
+        return primary_source, _normalize_site_url(job.url.strip())
+    return primary_source, None
+
+
 async def _upload_file(
     job: Job,
     fp: Path,
     media: downloader.ExtractedMedia,
     tag_result: dict,
     metadata: Optional[Dict] = None,
+    page_sources: Optional[Tuple[Optional[str], Optional[str]]] = None,
 ) -> Optional[dict]:
     """
     Upload a single file to Szurubooru (or merge with an existing duplicate).
     For TAG_EXISTING jobs, updates the existing post with new tags/safety only.
 
+    The tags from *tag_result* are ensured in Szurubooru while the existing post
+    (or duplicate) is being looked up, since the two requests are independent.
+    *page_sources* is ``_job_page_sources(job)``, computed once per job by the caller.
+
     Returns ``{"post": ..., "tags": ..., ...}`` on success, or None.
     """
     all_tags = tag_result["all_tags"]
     safety = tag_result["safety"]
+    tags_with_categories = tag_result["tags_with_categories"]
 
     if job.job_type == JobType.TAG_EXISTING:
         target_id = getattr(job, "target_szuru_post_id", None)
         if target_id is None:
             return None
-        existing = await szurubooru.get_post(target_id)
+        existing, _ = await asyncio.gather(
+            szurubooru.get_post(target_id),
+            szurubooru.ensure_tags_batch(tags_with_categories),
+        )
         if "error" in existing:
             logger.warning("Job %s: Failed to get post %d for update: %s",
                            job.id, target_id, existing.get("error"))
@@ -564,13 +1018,9 @@ async def _upload_file(
                 t["names"][0] if isinstance(t, dict) else t
                 for t in existing.get("tags", [])
             ]
-            final_tags = list(current_tags)
-            for tag in all_tags:
-                if not any(t.lower() == tag.lower() for t in final_tags):
-                    final_tags.append(tag)
+            final_tags = tag_utils.merge_tags(current_tags, all_tags)
         char_tags = tag_result.get("wd14_character_tags") or set()
-        for tag in char_tags:
-            await szurubooru.ensure_tag(tag, "character")
+        await szurubooru.ensure_tags_batch([(tag, "character") for tag in char_tags])
         result = await szurubooru.update_post(
             post_id=target_id,
             version=existing["version"],
@@ -593,36 +1043,37 @@ async def _upload_file(
 
     # Build source string using normalized deduplication
     # FILE jobs have no meaningful source URLs (media.source_url is "file://...")
-    primary_source = (job.source_override or "").strip() or None
-    if job.job_type == JobType.URL:
-        direct_media_url = media.source_url.strip() if media.source_url else None
-        original_page_url = _normalize_site_url(job.url.strip()) if job.url else None
+    primary_source, original_page_url = page_sources or _job_page_sources(job)
+    if job.job_type == JobType.URL and media.source_url:
+        direct_media_url = media.source_url.strip()
     else:
         direct_media_url = None
-        original_page_url = None
     final_source = source_utils.build_source_string(
         direct_media_url, original_page_url, primary_source
     )
 
     # Append source URLs from metadata (e.g. rule34vault data.sources)
     if metadata and final_source is not None:
-        for url in _extract_metadata_sources(metadata):
-            final_source = source_utils.append_source(final_source, url)
+        final_source = source_utils.merge_sources(final_source, _extract_metadata_sources(metadata))
     elif metadata:
         meta_sources = _extract_metadata_sources(metadata)
         if meta_sources:
             final_source = "\n".join(meta_sources)
 
-    # Check for duplicates via reverse search
-    existing = await szurubooru.reverse_search(fp)
+    # Content already on Szurubooru (uploaded by any job) is merged into its post
+    _, checksum = await asyncio.to_thread(file_digests, fp)
+    exact_post, _ = await asyncio.gather(
+        _find_exact_post(fp, checksum),
+        szurubooru.ensure_tags_batch(tags_with_categories),
+    )
     post: Optional[dict] = None
     merged = False
 
-    if existing.get("exactPost"):
+    if exact_post:
         logger.info("Job %s: Duplicate found for %s, merging with existing post %d",
-                     job.id, media.filename, existing["exactPost"]["id"])
+                     job.id, media.filename, exact_post["id"])
         post = await _merge_with_existing(
-            existing["exactPost"],
+            exact_post,
             all_tags,
             final_source,
             tag_result.get("wd14_character_tags"),
@@ -634,7 +1085,7 @@ async def _upload_file(
         )
         if "error" in result:
             error_text = result["error"]
-            if any(kw in error_text.lower() for kw in ("already uploaded", "duplicate", "content checksum")):
+            if _DUPLICATE_ERROR_RE.search(error_text):
                 logger.info("Job %s: Upload duplicate detected for %s", job.id, media.filename)
             else:
                 logger.warning("Job %s: Upload failed for %s: %s", job.id, media.filename, error_text)
@@ -656,6 +1107,22 @@ async def _upload_file(
     }
 
 
+async def _find_exact_post(fp: Path, checksum: str) -> Optional[dict]:
+    """
+    Return the post that already holds this file, found by Szurubooru content
+    checksum (SHA-1, the same match reverse search makes for its exact post,
+    without uploading the file). Reverse search is only the fallback when the
+    checksum query fails.
+    """
+    matches = await szurubooru.search_by_checksum(checksum)
+    if matches and "error" not in matches[0]:
+        return matches[0]
+    if not matches:
+        return None
+    existing = await szurubooru.reverse_search(fp)
+    return existing.get("exactPost")
+
+
 async def _merge_with_existing(
     existing_post: dict,
     new_tags: List[str],
@@ -676,29 +1143,25 @@ async def _merge_with_existing(
         # Merge sources with similarity detection
         new_source = current_source
         if source_url:
-            for url in source_url.split("\n"):
-                url = url.strip()
-                if url:
-                    new_source = source_utils.append_source(new_source, url)
+            new_source = source_utils.merge_sources(current_source, source_url.split("\n"))
 
         # Merge tags (deduplicate)
-        merged_tags = list(current_tags)
-        for tag in new_tags:
-            if not any(t.lower() == tag.lower() for t in merged_tags):
-                merged_tags.append(tag)
+        merged_tags = tag_utils.merge_tags(current_tags, new_tags)
 
         # Ensure character tags have proper category
         if character_tags:
-            for tag in character_tags:
-                await szurubooru.ensure_tag(tag, "character")
+            await szurubooru.ensure_tags_batch([(tag, "character") for tag in character_tags])
 
-        # Only update if there are changes
-        if merged_tags != current_tags or new_source != current_source:
+        # Only update if there are changes, and send only the fields that changed
+        # (merge_tags only ever appends, so a longer list means new tags)
+        tags_changed = len(merged_tags) != len(current_tags)
+        source_changed = new_source != current_source
+        if tags_changed or source_changed:
             result = await szurubooru.update_post(
                 post_id=existing_post["id"],
                 version=existing_post["version"],
-                tags=merged_tags,
-                source=new_source,
+                tags=merged_tags if tags_changed else None,
+                source=new_source if source_changed else None,
             )
             if "error" in result:
                 logger.warning("Failed to merge with existing post %d: %s",
@@ -714,10 +1177,15 @@ async def _merge_with_existing(
 
 
 async def _create_relations(job: Job, created_posts: List[dict]) -> None:
-    """Create bidirectional relations between all posts in a multi-file upload."""
+    """
+    Create bidirectional relations between all posts in a multi-file upload.
+
+    Szurubooru stores relations symmetrically, so once every other post lists the
+    last one, the last post already relates to all of them and needs no update.
+    """
     logger.info("Job %s: Creating relations between %d posts", job.id, len(created_posts))
     post_ids = [p["post"]["id"] for p in created_posts]
-    for post_info in created_posts:
+    for post_info in created_posts[:-1]:
         post = post_info["post"]
         other_ids = [pid for pid in post_ids if pid != post["id"]]
         if other_ids:
@@ -746,31 +1214,62 @@ def _progress_for_status(status: JobStatus) -> int:
     return 0
 
 
-async def _set_status(job: Job, status: JobStatus) -> None:
-    async with async_session() as db:
-        result = await db.execute(select(Job).where(Job.id == job.id))
-        j = result.scalar_one()
-        j.status = status
-        j.updated_at = datetime.now(timezone.utc)
+async def _set_status(job: Job, status: JobStatus, db: Optional[AsyncSession] = None) -> bool:
+    """
+    Move *job* to *status* unless it has been paused or stopped externally.
+
+    The pause/stop check and the transition are one conditional UPDATE, so a pause
+    that lands mid-job is never overwritten. Returns False (nothing written or
+    published) when the job is paused, stopped or gone. Re-entering the status the
+    job is already in (pipeline stages do this per media) only checks for a pause:
+    the row is not rewritten and nothing is published.
+    """
+    if job.status == status:
+        return not await _abort_if_paused_or_stopped(job, db)
+    async with _session_scope(db) as db:
+        result = await db.execute(
+            update(Job)
+            .where(Job.id == job.id, Job.status.notin_(ABORT_STATUSES))
+            .values(status=status, updated_at=func.now())
+            .returning(Job.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated = result.scalar_one_or_none() is not None
         await db.commit()
+    if not updated:
+        logger.info("Job %s was paused or stopped, aborting processing", job.id)
+        return False
+    job.status = status
     progress = _progress_for_status(status)
     await publish_job_update(job_id=job.id, status=status.value, progress=progress if progress else None)
+    return True
 
 
-async def _check_job_status(job: Job) -> Optional[JobStatus]:
+async def _check_job_status(job: Job, db: Optional[AsyncSession] = None) -> Optional[JobStatus]:
     """Check the current status of a job in the database."""
-    async with async_session() as db:
-        result = await db.execute(select(Job).where(Job.id == job.id))
-        j = result.scalar_one_or_none()
-        if j:
-            return j.status
-        return None
+    async with _session_scope(db) as db:
+        result = await db.execute(select(Job.status).where(Job.id == job.id))
+        status = result.scalar_one_or_none()
+        # Close the read transaction; a reused session would otherwise sit idle in it
+        await db.commit()
+        return status
+
 
+async def _abort_if_paused_or_stopped(job: Job, db: Optional[AsyncSession] = None) -> bool:
+    """
+    Return True if the job has been paused or stopped externally.
 
-async def _abort_if_paused_or_stopped(job: Job) -> bool:
-    """Return True if the job has been paused or stopped externally."""
-    current_status = await _check_job_status(job)
-    if current_status in (JobStatus.PAUSED, JobStatus.STOPPED):
+    While LISTEN is up, pauses and stops arrive as NOTIFYs, so the database is only
+    read for jobs that got one (or may have missed one).
+    """
+    job_key = str(job.id)
+    listening = _listener_conn is not None and not _listener_conn.is_closed()
+    if listening and job_key not in _abort_check_pending:
+        return False
+    # Cleared before reading, so a NOTIFY that lands during the query is kept
+    _abort_check_pending.discard(job_key)
+    current_status = await _check_job_status(job, db)
+    if current_status in ABORT_STATUSES:
         logger.info("Job %s was %s, aborting processing", job.id, current_status.value)
         return True
     return False
@@ -782,56 +1281,67 @@ async def _fail_job(
     *,
     max_retries: int = 0,
     retry_delay: float = 0.0,
+    db: Optional[AsyncSession] = None,
 ) -> None:
     """
     Mark a job as failed and, if configured, schedule an automatic retry using the same job ID.
     When retry_delay > 0, the job remains in FAILED status during the delay, then is set to PENDING.
+    A job paused or stopped meanwhile keeps that status (checked in the same UPDATE).
     """
-    expected_retry_count: int
-    async with async_session() as db:
-        result = await db.execute(select(Job).where(Job.id == job.id))
-        j = result.scalar_one()
-
-        # Increment retry counter
-        current_retries = j.retry_count or 0
-        current_retries += 1
-        j.retry_count = current_retries
-        expected_retry_count = current_retries
-
-        should_retry = max_retries > 0 and current_retries <= max_retries
-
-        j.error_message = error[:4000]
-        j.updated_at = datetime.now(timezone.utc)
-
-        if should_retry and retry_delay > 0:
-            # Keep job as FAILED during delay - will be set to PENDING after delay
-            j.status = JobStatus.FAILED
-        elif should_retry:
-            # Immediate retry - set to PENDING now
-            j.status = JobStatus.PENDING
-        else:
-            j.status = JobStatus.FAILED
+    # Truncate once up front; everything below only needs a prefix of the text
+    error = error[:_MAX_ERROR_LENGTH]
 
+    # With a delay the job stays FAILED until _delayed_retry sets it PENDING;
+    # otherwise it goes straight back to PENDING
+    retry_status = JobStatus.FAILED if retry_delay > 0 else JobStatus.PENDING
+
+    # The counter is incremented in SQL (the in-memory row dates from the claim and
+    # may be stale if the job was reset via the API), so the retry decision is too
+    async with _session_scope(db) as db:
+        result = await db.execute(
+            update(Job)
+            .where(Job.id == job.id, Job.status.notin_(ABORT_STATUSES))
+            .values(
+                status=case(
+                    (Job.retry_count < max_retries, literal(retry_status, Job.status.type)),
+                    else_=literal(JobStatus.FAILED, Job.status.type),
+                ),
+                retry_count=Job.retry_count + 1,
+                error_message=error,
+                updated_at=func.now(),
+            )
+            .returning(Job.retry_count)
+            .execution_options(synchronize_session=False)
+        )
+        current_retries = result.scalar_one_or_none()
         await db.commit()
+    if current_retries is None:
+        logger.info("Job %s was paused or stopped, not marking it failed", job.id)
+        return
+    expected_retry_count = current_retries
+    should_retry = max_retries > 0 and current_retries <= max_retries
+    job.status = retry_status if should_retry else JobStatus.FAILED
+    job.retry_count = current_retries
 
     if should_retry and retry_delay > 0:
         async def _delayed_retry() -> None:
             # Wait for the delay, then set job to PENDING if it's still eligible
             await asyncio.sleep(retry_delay)
             async with async_session() as db:
-                result = await db.execute(select(Job).where(Job.id == job.id))
-                j = result.scalar_one_or_none()
-                if not j:
-                    return
-                # Only retry if still in FAILED status and retry count hasn't changed
-                if j.status != JobStatus.FAILED:
-                    return
-                if (j.retry_count or 0) != expected_retry_count:
-                    return
-                # Set to PENDING so worker can pick it up
-                j.status = JobStatus.PENDING
-                j.updated_at = datetime.now(timezone.utc)
+                # Only retry if still in FAILED status and retry count hasn't changed;
+                # set to PENDING so worker can pick it up
+                result = await db.execute(
+                    update(Job)
+                    .where(
+                        Job.id == job.id,
+                        Job.status == JobStatus.FAILED,
+                        Job.retry_count == expected_retry_count,
+                    )
+                    .values(status=JobStatus.PENDING, updated_at=func.now())
+                )
                 await db.commit()
+                if result.rowcount == 0:
+                    return
             # Set retries_exhausted=False since we're retrying
             await publish_job_update(
                 job_id=job.id, 
@@ -884,30 +1394,37 @@ async def _complete_job(
     stored_sources: Optional[str] = None,
     was_merge: bool = False,
     safety: Optional[str] = None,
+    db: Optional[AsyncSession] = None,
 ) -> None:
-    async with async_session() as db:
-        result = await db.execute(select(Job).where(Job.id == job.id))
-        j = result.scalar_one()
-        j.status = JobStatus.MERGED if was_merge else JobStatus.COMPLETED
-        j.szuru_post_id = szuru_post_id
-        if safety:
-            j.safety = safety
-        # Exclude primary post from relations so a post is never its own relation
-        raw = related_post_ids or []
-        j.related_post_ids = [pid for pid in raw if pid != szuru_post_id]
-        j.was_merge = 1 if was_merge else 0
-        j.tags_applied = json.dumps(tags)
-        j.tags_from_source = json.dumps(tags_from_source)
-        j.tags_from_ai = json.dumps(tags_from_ai)
-        if stored_sources:
-            j.source_override = stored_sources
-
-        now = datetime.now(timezone.utc)
-        j.updated_at = now
-        j.completed_at = now
-        started = getattr(j, "started_at", None)
-        duration_seconds = (now - started).total_seconds() if started else None
+    status = JobStatus.MERGED if was_merge else JobStatus.COMPLETED
+    # Exclude primary post from relations so a post is never its own relation
+    raw = related_post_ids or []
+    values = {
+        "status": status,
+        "szuru_post_id": szuru_post_id,
+        "related_post_ids": [pid for pid in raw if pid != szuru_post_id],
+        "was_merge": 1 if was_merge else 0,
+        "tags_applied": orjson.dumps(tags).decode(),
+        "tags_from_source": orjson.dumps(tags_from_source).decode(),
+        "tags_from_ai": orjson.dumps(tags_from_ai).decode(),
+    }
+    if safety:
+        values["safety"] = safety
+    if stored_sources:
+        values["source_override"] = stored_sources
+
+    # Timestamps come from the database clock; completed_at is read back for the SSE event
+    values["updated_at"] = func.now()
+    values["completed_at"] = func.now()
+    async with _session_scope(db) as db:
+        result = await db.execute(
+            update(Job).where(Job.id == job.id).values(**values).returning(Job.completed_at)
+        )
+        now = result.scalar_one_or_none()
         await db.commit()
+    started = getattr(job, "started_at", None)
+    duration_seconds = (now - started).total_seconds() if started and now else None
+    job.status = status
     logger.info("Job %s completed -> Szuru post %d (related: %s)",
                 job.id, szuru_post_id, related_post_ids or [])
     await publish_job_update(
@@ -0,0 +1,58 @@
+"""Tests for direct media downloads."""
+
+import asyncio
+
+from app.services import downloader
+
+BODY_SIZE = 1_000_000
+
+
+async def _serve_truncated_body(reader, writer):
+    """Announce a BODY_SIZE image, send part of it, then drop the connection."""
+    await reader.readuntil(b"\r\n\r\n")
+    writer.write(
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: image/png\r\n"
+        + f"Content-Length: {BODY_SIZE}\r\n\r\n".encode()
+        + b"\x89PNG" + b"\0" * 4096
+    )
+    await writer.drain()
+    writer.close()
+
+
+async def _serve_image(reader, writer):
+    await reader.readuntil(b"\r\n\r\n")
+    writer.write(
+        b"HTTP/1.1 200 OK\r\nContent-Type: image/png\r\n"
+        + f"Content-Length: {BODY_SIZE}\r\n\r\n".encode()
+        + b"\0" * BODY_SIZE
+    )
+    await writer.drain()
+    writer.close()
+
+
+def _download(handler, dest_dir):
+    async def run():
+        server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await downloader.download_direct_media_url(
+                f"http://127.0.0.1:{port}/media/1.png", str(dest_dir), filename="1.png"
+            )
+
+    return asyncio.run(run())
+
+
+def test_direct_download_saves_file(tmp_path):
+    result = _download(_serve_image, tmp_path)
+    assert result.error is None
+    assert result.files == [tmp_path / "1.png"]
+    assert (tmp_path / "1.png").stat().st_size == BODY_SIZE
+    assert [p.name for p in tmp_path.iterdir()] == ["1.png"]
+
+
+def test_direct_download_failing_mid_stream_leaves_no_partial_file(tmp_path):
+    result = _download(_serve_truncated_body, tmp_path)
+    assert result.error
+    assert result.files == []
+    assert list(tmp_path.iterdir()) == []
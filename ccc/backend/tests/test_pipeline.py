@@ -0,0 +1,84 @@
+"""Tests for the download -> tag -> upload media pipeline."""
+
+import asyncio
+import dataclasses
+import uuid
+
+import pytest
+
+from app.database import Job, JobStatus, JobType
+from app.services import downloader, tagger
+from app.workers import processor
+
+MEDIA_COUNT = 8
+
+
+@pytest.fixture
+def pipeline(monkeypatch, tmp_path):
+    """Stub every I/O step of the pipeline; returns the shared call log."""
+    monkeypatch.setattr(processor, "settings", dataclasses.replace(
+        processor.settings, wd14_batch_size=1, media_download_concurrency=4, media_upload_concurrency=2,
+    ))
+    state = {"paused": False, "pause_on_download": None, "statuses": [], "uploaded": []}
+
+    async def download_media(job, media, media_dir, user_config=None):
+        if state["pause_on_download"] == media.filename:
+            state["paused"] = True
+        await asyncio.sleep(0)
+        return [tmp_path / media.filename], {}
+
+    async def abort_if_paused_or_stopped(job, db=None):
+        return state["paused"]
+
+    async def set_status(job, status, db=None):
+        if state["paused"]:
+            return False
+        state["statuses"].append(status)
+        return True
+
+    async def tag_images(job, files):
+        return {}
+
+    async def tag_file(job, fp, metadata, user_category_mappings, wd14_result):
+        return tagger.TagResult()
+
+    async def upload_file(job, fp, media, tag_result, metadata, page_sources):
+        state["uploaded"].append(media.filename)
+        return {"id": int(media.filename.split(".")[0])}
+
+    monkeypatch.setattr(processor, "_download_media", download_media)
+    monkeypatch.setattr(processor, "_abort_if_paused_or_stopped", abort_if_paused_or_stopped)
+    monkeypatch.setattr(processor, "_set_status", set_status)
+    monkeypatch.setattr(processor, "_tag_images", tag_images)
+    monkeypatch.setattr(processor, "_tag_file", tag_file)
+    monkeypatch.setattr(processor, "_upload_file", upload_file)
+    state["job_dir"] = tmp_path
+    return state
+
+
+def _run(job_dir):
+    job = Job(id=uuid.uuid4(), job_type=JobType.URL, url="https://example.com/gallery/1", skip_tagging=0)
+    media = [
+        downloader.ExtractedMedia(url=job.url, source_url=f"https://cdn.example.com/{i}.png", filename=f"{i}.png")
+        for i in range(MEDIA_COUNT)
+    ]
+    coro = processor._run_media_pipeline(job, media, job_dir, None, None, db=None)
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+def test_pipeline_uploads_every_media_in_order(pipeline):
+    created, last_error, aborted = _run(pipeline["job_dir"])
+    assert not aborted and last_error is None
+    assert [post["id"] for post in created] == list(range(MEDIA_COUNT))
+    assert pipeline["statuses"] == [JobStatus.TAGGING, JobStatus.UPLOADING]
+
+
+def test_pause_during_download_does_not_block_pipeline(pipeline):
+    # The tag queue holds fewer items than there are downloads in flight, so a tag
+    # stage that stopped draining after the abort would leave downloads stuck on put()
+    pipeline["pause_on_download"] = "0.png"
+    created, last_error, aborted = _run(pipeline["job_dir"])
+    assert aborted
+    assert created == [] and pipeline["uploaded"] == []
+    assert last_error is None
+    assert pipeline["statuses"] == []
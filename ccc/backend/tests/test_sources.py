@@ -0,0 +1,19 @@
+"""Tests for post source string handling."""
+
+from app.services.sources import merge_sources
+
+
+def test_merge_sources_skips_normalized_duplicates():
+    existing = "https://example.com/post/1"
+    merged = merge_sources(existing, [
+        "http://EXAMPLE.com/post/1/?utm_source=x",
+        "  ",
+        "https://other.example/a",
+        "https://other.example/a",
+    ])
+    assert merged == "https://example.com/post/1\nhttps://other.example/a"
+
+
+def test_merge_sources_without_existing():
+    assert merge_sources(None, []) is None
+    assert merge_sources(None, ["https://a.example/1"]) == "https://a.example/1"
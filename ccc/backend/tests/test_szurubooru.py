@@ -0,0 +1,133 @@
+"""Tests for the Szurubooru API client."""
+
+import asyncio
+
+import pytest
+
+from app.services import szurubooru
+
+OK = {"id": 1}
+DOWN = {"error": "Service Unavailable", "status": 503}
+TIMEOUT = {"error": "timed out", "status": 0}
+NOT_SENT = {"error": "Cannot connect to host", "status": 0, "not_sent": True}
+REFUSED = "too many recent failures"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_breaker(monkeypatch):
+    szurubooru._circuits.clear()
+    monkeypatch.setattr(szurubooru, "RETRY_BASE_DELAY", 0)
+    yield
+    szurubooru._circuits.clear()
+
+
+def _calls(*results):
+    """A call() returning *results* in turn, counting invocations."""
+    remaining = list(results)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        return remaining.pop(0)
+
+    return call, calls
+
+
+def _circuit():
+    return szurubooru._circuits[""]
+
+
+def _open_circuit():
+    for _ in range(szurubooru.BREAKER_FAILURE_THRESHOLD // szurubooru.RETRY_ATTEMPTS + 1):
+        asyncio.run(szurubooru._with_retry(_calls(*[DOWN] * szurubooru.RETRY_ATTEMPTS)[0]))
+    assert _circuit().open_until > 0
+
+
+def test_retry_succeeds_after_transient_failure():
+    call, calls = _calls(DOWN, TIMEOUT, OK)
+    assert asyncio.run(szurubooru._with_retry(call)) == OK
+    assert len(calls) == 3
+    assert _circuit().failures == 0
+
+
+def test_client_errors_are_not_retried():
+    call, calls = _calls({"error": "bad request", "status": 400})
+    assert asyncio.run(szurubooru._with_retry(call))["status"] == 400
+    assert len(calls) == 1
+
+
+def test_non_idempotent_call_only_retries_unsent_requests():
+    call, calls = _calls(TIMEOUT, OK)
+    assert asyncio.run(szurubooru._with_retry(call, idempotent=False)) == TIMEOUT
+    assert len(calls) == 1
+
+    call, calls = _calls(NOT_SENT, OK)
+    assert asyncio.run(szurubooru._with_retry(call, idempotent=False)) == OK
+    assert len(calls) == 2
+
+
+def test_breaker_opens_after_threshold_and_fails_fast():
+    _open_circuit()
+    call, calls = _calls(OK)
+    result = asyncio.run(szurubooru._with_retry(call))
+    assert REFUSED in result["error"]
+    assert calls == []
+
+
+def test_half_open_admits_a_single_probe():
+    _open_circuit()
+    _circuit().open_until = 1.0  # window expired
+    release = asyncio.Event()
+    probes = []
+
+    async def probe():
+        probes.append(1)
+        await release.wait()
+        return OK
+
+    async def run():
+        first = asyncio.create_task(szurubooru._with_retry(probe))
+        await asyncio.sleep(0)
+        other = await szurubooru._with_retry(probe)
+        release.set()
+        return await first, other
+
+    first, other = asyncio.run(run())
+    assert first == OK
+    assert REFUSED in other["error"]
+    assert len(probes) == 1
+    # The successful probe closed the circuit
+    assert _circuit().open_until == 0 and _circuit().failures == 0
+    assert asyncio.run(szurubooru._with_retry(_calls(OK)[0])) == OK
+
+
+def test_failed_probe_reopens_circuit():
+    _open_circuit()
+    _circuit().open_until = 1.0
+    call, calls = _calls(DOWN, OK)
+    assert asyncio.run(szurubooru._with_retry(call)) == DOWN
+    assert len(calls) == 1
+    assert _circuit().open_until > 1.0 and not _circuit().probing
+
+
+def test_lookup_existing_tags_chunks_and_skips_unqueryable_names(monkeypatch):
+    queries = []
+
+    async def fake_search_tags(query, limit=20, offset=0):
+        queries.append((query, limit))
+        names = query[len("name:"):].split(",")
+        if "tag_60" in names:
+            return {"error": "boom", "status": 500}
+        return {"results": [{"names": [n.upper()], "category": {"name": "General"}} for n in names]}
+
+    monkeypatch.setattr(szurubooru, "search_tags", fake_search_tags)
+    names = [f"tag_{i}" for i in range(szurubooru._TAG_LOOKUP_CHUNK + 20)]
+    names += ["a,b", "star*", "ns:tag", "back\\slash", "-negated"]
+
+    found = asyncio.run(szurubooru._lookup_existing_tags(names))
+
+    assert [limit for _, limit in queries] == [szurubooru._TAG_LOOKUP_CHUNK, 20]
+    assert all(not any(c in q[len("name:"):] for c in "*:\\") for q, _ in queries)
+    assert not any(name.startswith("-") for q, _ in queries for name in q[len("name:"):].split(","))
+    # First chunk found (keys lowercased), the failed second chunk left out
+    assert found == {f"tag_{i}": "general" for i in range(szurubooru._TAG_LOOKUP_CHUNK)}
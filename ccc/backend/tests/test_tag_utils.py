@@ -0,0 +1,22 @@
+"""Tests for tag list helpers."""
+
+from app.services.tag_categories import split_tag_string
+from app.services.tag_utils import merge_tags
+
+
+def test_merge_tags_appends_only_new_tags_case_insensitively():
+    assert merge_tags(["Cat", "dog"], ["cat", "bird", "DOG", "Bird", "fish"]) == [
+        "Cat", "dog", "bird", "fish",
+    ]
+
+
+def test_merge_tags_keeps_existing_tags_as_is():
+    existing = ["a", "A", "b"]
+    assert merge_tags(existing, []) == ["a", "A", "b"]
+    assert merge_tags(existing, ["c"]) == ["a", "A", "b", "c"]
+    assert existing == ["a", "A", "b"]
+
+
+def test_metadata_tag_strings_split_on_commas_and_whitespace():
+    assert split_tag_string("a,b  c,\tD,,") == ["a", "b", "c", "D"]
+    assert split_tag_string(" , ") == []